@@ -443,30 +443,18 @@ Button.-primary:hover {
         if user_action:
             self._tab_override = True
         self._active_tab = "home"
-        try:
-            self.query_one("#home").display = True
-        except Exception:
-            pass
+        self.query("#home").set(display=True)
         for id_ in ("controls", "main", "input-area"):
-            try:
-                self.query_one(f"#{id_}").display = False
-            except Exception:
-                pass
+            self.query(f"#{id_}").set(display=False)
         self._set_active_tab("tab-home")
 
     def show_chat(self, user_action: bool = False):
         if user_action:
             self._tab_override = True
         self._active_tab = "chat"
-        try:
-            self.query_one("#home").display = False
-        except Exception:
-            pass
+        self.query("#home").set(display=False)
         for id_ in ("controls", "main", "input-area"):
-            try:
-                self.query_one(f"#{id_}").display = True
-            except Exception:
-                pass
+            self.query(f"#{id_}").set(display=True)
         if not getattr(self, "_chat_reveal_done", False):
             self._chat_reveal_done = True
             try:
@@ -475,10 +463,7 @@ Button.-primary:hover {
                 pass
         self._set_active_tab("tab-chat")
         self._update_welcome_screen()
-        try:
-            self.query_one("#user-input").focus()
-        except Exception:
-            pass
+        self.query("#user-input").focus()
 
 
 
@@ -534,7 +519,7 @@ Button.-primary:hover {
         self.populate_models()
         # state for summary preview/interaction
         self._last_summary = None
-        self._last_summary_widgets = []
+        self._last_summary_widgets = {}
         # spinner control flag
         self._spinner_running = False
         # Conversations state
@@ -542,6 +527,9 @@ Button.-primary:hover {
         self._current_conv_id = None
         self._show_agents = False
         self._awaiting_editor_key = False
+        self._editor_timer = None
+        self._compact_state = None  # last applied compact flag
+        self._resize_timer = None
         self._show_sidebar = False
         self._sidebar_variant = "standard"
         self._use_custom_welcome = False
@@ -550,6 +538,9 @@ Button.-primary:hover {
         self._send_multi_mode = False
         self._tokens_used = 0
         self._cost_spent = 0.0
+        # cached references to hot widgets (see _chat_box / _input_box)
+        self._chat_history = self.query_one("#chat-history")
+        self._user_input = self.query_one("#user-input")
         self.load_conversations()
         self.render_conversation_list()
         # ensure there is at least one conversation selected
@@ -752,8 +743,7 @@ Button.-primary:hover {
 
     # ---- Conversation persistence and UI helpers ----
     def _conversations_file_path(self):
-        p = Path(__file__).resolve().parent / 'conversations.json'
-        return p
+        return convs.conversations_file_path()
 
     def load_conversations(self):
         p = self._conversations_file_path()
@@ -783,11 +773,7 @@ Button.-primary:hover {
         try:
             conv_list = self.query_one('#conv-list')
             # clear
-            for child in list(getattr(conv_list, 'children', [])):
-                try:
-                    child.remove()
-                except Exception:
-                    pass
+            conv_list.remove_children()
             # mount buttons (show last-updated if present), apply search filter
             q = getattr(self, '_conv_search', '') or ''
             for conv in sorted(self._conversations, key=lambda c: c.get('last_updated', 0), reverse=True):
@@ -806,10 +792,7 @@ Button.-primary:hover {
                 btn = Button(label, id=f"conv-{conv['id']}", classes="conv-btn")
                 conv_list.mount(btn)
             # remove any lingering context menu
-            try:
-                self.query_one('#conv-context').remove()
-            except Exception:
-                pass
+            self.query('#conv-context').remove()
         except Exception:
             pass
 
@@ -875,11 +858,7 @@ Button.-primary:hover {
         try:
             chat_box = self.query_one('#chat-history')
             # remove previous message widgets
-            for child in list(getattr(chat_box, 'children', [])):
-                try:
-                    child.remove()
-                except Exception:
-                    pass
+            chat_box.remove_children()
             for msg in conv.get('messages', []):
                     role = msg.get('role')
                     content = msg.get('content')
@@ -908,11 +887,7 @@ Button.-primary:hover {
             # clear chat
             try:
                 chat_box = self.query_one('#chat-history')
-                for child in list(getattr(chat_box, 'children', [])):
-                    try:
-                        child.remove()
-                    except Exception:
-                        pass
+                chat_box.remove_children()
             except Exception:
                 pass
 
@@ -995,6 +970,20 @@ Button.-primary:hover {
                 pass
 
     # ---- Helpers: sanitizers, model listing, agents UI ----
+    def _chat_box(self):
+        """Return the cached chat history container, re-resolving it if it was unmounted."""
+        chat_box = getattr(self, "_chat_history", None)
+        if chat_box is None or not chat_box.is_mounted:
+            chat_box = self._chat_history = self.query_one("#chat-history")
+        return chat_box
+
+    def _input_box(self):
+        """Return the cached message input, re-resolving it if it was unmounted."""
+        inp = getattr(self, "_user_input", None)
+        if inp is None or not inp.is_mounted:
+            inp = self._user_input = self.query_one("#user-input")
+        return inp
+
     def _sanitize_id(self, name: str) -> str:
         try:
             return sanitize_id(name)
@@ -1036,12 +1025,9 @@ Button.-primary:hover {
     def _render_models_in_agents(self, panel):
         try:
             # clear existing model rows
-            for child in list(getattr(panel, 'children', [])):
-                try:
-                    if getattr(child, 'id', '') and child.id.startswith('model-row-'):
-                        child.remove()
-                except Exception:
-                    pass
+            panel.remove_children(
+                [child for child in panel.children if (child.id or '').startswith('model-row-')]
+            )
             models = self.list_models()
             for m in models:
                 name = m.get('name') or str(m)
@@ -1065,10 +1051,7 @@ Button.-primary:hover {
         """
         try:
             # remove existing confirm
-            try:
-                self.query_one('#delete-confirm').remove()
-            except Exception:
-                pass
+            self.query('#delete-confirm').remove()
             box = Vertical(id='delete-confirm')
             if kind == 'model':
                 box.mount(Label(f"Confirm delete model: {name}?"))
@@ -1095,10 +1078,7 @@ Button.-primary:hover {
     def cancel_delete_confirm(self):
         try:
             self._pending_delete = None
-            try:
-                self.query_one('#delete-confirm').remove()
-            except Exception:
-                pass
+            self.query('#delete-confirm').remove()
         except Exception:
             pass
 
@@ -1126,10 +1106,7 @@ Button.-primary:hover {
     def show_conv_context(self, conv_id: str):
         try:
             # remove existing
-            try:
-                self.query_one('#conv-context').remove()
-            except Exception:
-                pass
+            self.query('#conv-context').remove()
             ctx = Vertical(id='conv-context')
             ctx.mount(Button('Rename', id=f'ctx-rename-{conv_id}', classes='ctx-btn'))
             ctx.mount(Button('Delete', id=f'ctx-delete-{conv_id}', classes='ctx-btn'))
@@ -1147,10 +1124,7 @@ Button.-primary:hover {
 
     def hide_conv_context(self):
         try:
-            try:
-                self.query_one('#conv-context').remove()
-            except Exception:
-                pass
+            self.query('#conv-context').remove()
         except Exception:
             pass
 
@@ -1158,18 +1132,12 @@ Button.-primary:hover {
         try:
             panel = self.query_one('#agents-panel')
             # add a refresh indicator
-            try:
-                panel.query_one('#models-refresh-msg').remove()
-            except Exception:
-                pass
+            panel.query('#models-refresh-msg').remove()
             panel.mount(Label('Refreshing models...', id='models-refresh-msg', classes='system-msg'))
             try:
                 self._render_models_in_agents(panel)
             finally:
-                try:
-                    panel.query_one('#models-refresh-msg').remove()
-                except Exception:
-                    pass
+                panel.query('#models-refresh-msg').remove()
         except Exception:
             pass
 
@@ -1198,10 +1166,7 @@ Button.-primary:hover {
         finally:
             try:
                 if panel:
-                    try:
-                        panel.query_one(f"#model-op-{sid}").remove()
-                    except Exception:
-                        pass
+                    panel.query(f"#model-op-{sid}").remove()
             except Exception:
                 pass
 
@@ -1228,10 +1193,7 @@ Button.-primary:hover {
         finally:
             try:
                 if panel:
-                    try:
-                        panel.query_one(f"#model-op-{sid}").remove()
-                    except Exception:
-                        pass
+                    panel.query(f"#model-op-{sid}").remove()
             except Exception:
                 pass
 
@@ -1317,14 +1279,15 @@ Button.-primary:hover {
 
             def _preview():
                 md = Markdown(f"**Summary preview**\n\n{final_summary}")
-                btns = Horizontal()
-                btns.mount(Button("Edit Summary", id="edit-summary"))
-                btns.mount(Button("Append Summary", id="append-summary"))
-                btns.mount(Button("Replace Input", id="replace-summary"))
-                btns.mount(Button("Cancel", id="cancel-summary"))
+                btns = Horizontal(
+                    Button("Edit Summary", id="edit-summary"),
+                    Button("Append Summary", id="append-summary"),
+                    Button("Replace Input", id="replace-summary"),
+                    Button("Cancel", id="cancel-summary"),
+                )
                 chat_box.mount(md)
                 chat_box.mount(btns)
-                self._last_summary_widgets = [md, btns]
+                self._last_summary_widgets = {"preview": md, "preview_btns": btns}
                 chat_box.mount(Label("System: Summary ready. Choose an action.", classes="system-msg"))
                 try:
                     conv = self._get_conversation()
@@ -1433,10 +1396,7 @@ Button.-primary:hover {
             except Exception:
                 panel_exists = False
             if panel_exists:
-                try:
-                    self.query_one('#agents-panel').remove()
-                except Exception:
-                    pass
+                self.query('#agents-panel').remove()
                 self._show_agents = False
                 return
             # create an agents panel with model management
@@ -1586,10 +1546,7 @@ Button.-primary:hover {
             elif command_id == "view.toggle_welcome_style":
                 self.toggle_welcome_style()
             elif command_id == "view.focus_input":
-                try:
-                    self.query_one("#user-input").focus()
-                except Exception:
-                    pass
+                self.query("#user-input").focus()
             elif command_id == "view.toggle_agents":
                 self.toggle_agents()
             elif command_id == "model.refresh":
@@ -1683,364 +1640,400 @@ Button.-primary:hover {
             return
 
     def on_button_pressed(self, event):
-        if event.button.id == "tab-home":
-            self.show_home(user_action=True)
-        elif event.button.id == "tab-chat":
-            self.show_chat(user_action=True)
-        elif event.button.id == "send-btn":
-            inp = self.query_one("#user-input")
-            user_text = inp.value
-            selector = self.query_one("#model-selector")
-            model = getattr(selector, "value", None) or "llama3" # Default fallback
-            
-            if user_text:
-                # Append to UI
-                self.query_one("#chat-history").mount(Label(f"You: {user_text}", classes="user-msg"))
-                # Save to current conversation
-                try:
-                    self._append_conversation_message('user', user_text)
-                except Exception:
-                    pass
-                # Ask AI
-                self.get_ai_response(user_text, model)
-                inp.value = ""
-        elif event.button.id == "btn-yt":
-            inp = self.query_one("#user-input")
-            user_text = inp.value or ""
-            if not user_text:
-                self.query_one("#chat-history").mount(Label("Please paste a YouTube URL into the input first.", classes="error-msg"))
-            else:
-                # Determine desired action from selector and kick off background worker
-                action_selector = self.query_one("#yt-action")
-                action = getattr(action_selector, "value", None) or "summarize_append"
-                selector = self.query_one("#model-selector")
-                model = getattr(selector, "value", None) or "llama3"
-                self.fetch_and_process_transcript(user_text, action, model)
-        elif event.button.id == "send-selected":
-            inp = self.query_one("#user-input")
-            user_text = inp.value or ""
-            if not user_text:
-                self.query_one('#chat-history').mount(Label('Please enter a message to send.', classes='error-msg'))
-            elif not self._selected_models:
-                self.query_one('#chat-history').mount(Label('No models selected. Use the Agents panel to include models.', classes='error-msg'))
+        button_id = event.button.id or ""
+        handler = self._BUTTON_HANDLERS.get(button_id)
+        if handler is None:
+            for prefix, prefix_handler in self._BUTTON_PREFIX_HANDLERS:
+                if button_id.startswith(prefix):
+                    handler = prefix_handler
+                    break
             else:
-                # Show user message once
-                self.query_one('#chat-history').mount(Label(f"You: {user_text}", classes='user-msg'))
-                # Save to conversation and create a turn id for grouped responses
-                turn_id = str(uuid.uuid4())[:8]
-                try:
-                    self._append_conversation_message('user', user_text, turn_id=turn_id)
-                except Exception:
-                    pass
+                return
+        handler(self, button_id)
 
-                models_to_send = list(self._selected_models)
-                # mount grouped UI
-                try:
-                    self.create_response_group(turn_id, user_text, models_to_send)
-                except Exception:
-                    pass
+    # ---- Button handlers (dispatched by id from on_button_pressed) ----
+    def _handle_tab_home(self, button_id: str):
+        self.show_home(user_action=True)
 
-                # Send to each selected model (concurrently via work) and pass turn_id
-                for mod in models_to_send:
-                    try:
-                        self.get_ai_response(user_text, mod, turn_id=turn_id)
-                    except Exception:
-                        try:
-                            self.query_one('#chat-history').mount(Label(f'Error scheduling send to {mod}', classes='error-msg'))
-                        except Exception:
-                            pass
-                inp.value = ""
-        elif event.button.id == "create-conv":
-            self.create_conversation()
-        elif event.button.id == "delete-conv":
-            if self._current_conv_id:
-                # show confirmation first
-                self.show_delete_confirm('conv', self._current_conv_id)
-        elif event.button.id == "rename-conv":
-            self.start_rename()
-        elif event.button.id == "save-rename":
-            try:
-                inp = self.query_one('#rename-input')
-                new_title = inp.value
-                # cleanup rename widgets
-                for child in list(getattr(self.query_one('#conversations'), 'children', [])):
-                    try:
-                        if getattr(child, 'id', '') in ('rename-input',):
-                            child.remove()
-                    except Exception:
-                        pass
-                for child in list(getattr(self.query_one('#conversations'), 'children', [])):
-                    try:
-                        # remove the Horizontal buttons group too if present
-                        if isinstance(child, type(self.query_one('#conversations'))):
-                            pass
-                    except Exception:
-                        pass
-            except Exception:
-                new_title = None
-            if new_title:
-                self.finish_rename(new_title)
-        elif event.button.id == 'agent-build':
+    def _handle_tab_chat(self, button_id: str):
+        self.show_chat(user_action=True)
+
+    def _handle_send(self, button_id: str):
+        inp = self._input_box()
+        user_text = inp.value
+        selector = self.query_one("#model-selector")
+        model = getattr(selector, "value", None) or "llama3" # Default fallback
+
+        if user_text:
+            # Append to UI
+            self._chat_box().mount(Label(f"You: {user_text}", classes="user-msg"))
+            # Save to current conversation
             try:
-                self.query_one('#chat-history').mount(Label('System: Build agent triggered (mock).', classes='system-msg'))
+                self._append_conversation_message('user', user_text)
             except Exception:
                 pass
-        elif event.button.id == 'agent-test':
+            # Ask AI
+            self.get_ai_response(user_text, model)
+            inp.value = ""
+
+    def _handle_pull_transcript(self, button_id: str):
+        inp = self._input_box()
+        user_text = inp.value or ""
+        if not user_text:
+            self._chat_box().mount(Label("Please paste a YouTube URL into the input first.", classes="error-msg"))
+        else:
+            # Determine desired action from selector and kick off background worker
+            action_selector = self.query_one("#yt-action")
+            action = getattr(action_selector, "value", None) or "summarize_append"
+            selector = self.query_one("#model-selector")
+            model = getattr(selector, "value", None) or "llama3"
+            self.fetch_and_process_transcript(user_text, action, model)
+
+    def _handle_send_selected(self, button_id: str):
+        inp = self._input_box()
+        user_text = inp.value or ""
+        if not user_text:
+            self._chat_box().mount(Label('Please enter a message to send.', classes='error-msg'))
+        elif not self._selected_models:
+            self._chat_box().mount(Label('No models selected. Use the Agents panel to include models.', classes='error-msg'))
+        else:
+            # Show user message once
+            self._chat_box().mount(Label(f"You: {user_text}", classes='user-msg'))
+            # Save to conversation and create a turn id for grouped responses
+            turn_id = str(uuid.uuid4())[:8]
             try:
-                self.query_one('#chat-history').mount(Label('System: Test agent triggered (mock).', classes='system-msg'))
+                self._append_conversation_message('user', user_text, turn_id=turn_id)
             except Exception:
                 pass
-        elif event.button.id == 'refresh-models':
-            self.refresh_models_panel()
-        elif event.button.id.startswith('pull-'):
-            s = event.button.id.split('pull-')[1]
-            # find model by sanitized name
-            models = self.list_models()
-            for m in models:
-                name = m.get('name') or str(m)
-                if self._sanitize_id(name) == s:
-                    self.pull_model(name)
-                    # refresh the panel after some delay
-                    threading.Thread(target=lambda: (time.sleep(0.5), self.refresh_models_panel()), daemon=True).start()
-                    break
-        elif event.button.id.startswith('select-'):
-            s = event.button.id.split('select-')[1]
-            models = self.list_models()
-            for m in models:
-                name = m.get('name') or str(m)
-                if self._sanitize_id(name) == s:
-                    if name in self._selected_models:
-                        self._selected_models.remove(name)
-                        try:
-                            btn = self.query_one(f"#select-{s}")
-                            btn.update('Include')
-                        except Exception:
-                            pass
-                    else:
-                        self._selected_models.add(name)
-                        try:
-                            btn = self.query_one(f"#select-{s}")
-                            btn.update('Included')
-                        except Exception:
-                            pass
-                    break
-        elif event.button.id == 'select-all-models':
-            # select all available models
+
+            models_to_send = list(self._selected_models)
+            # mount grouped UI
             try:
-                models = self.list_models()
-                for m in models:
-                    name = m.get('name') or str(m)
-                    self._selected_models.add(name)
-                self.refresh_models_panel()
+                self.create_response_group(turn_id, user_text, models_to_send)
             except Exception:
                 pass
-        elif event.button.id.startswith('delete-'):
-            s = event.button.id.split('delete-')[1]
-            models = self.list_models()
-            for m in models:
-                name = m.get('name') or str(m)
-                if self._sanitize_id(name) == s:
-                    self.show_delete_confirm('model', name)
-                    break
-        elif event.button.id.startswith('use-'):
-            s = event.button.id.split('use-')[1]
-            models = self.list_models()
-            for m in models:
-                name = m.get('name') or str(m)
-                if self._sanitize_id(name) == s:
-                    self.set_conversation_model(name)
-                    break
-        elif event.button.id == 'cancel-delete':
-            self.cancel_delete_confirm()
-        elif event.button.id.startswith('confirm-delete-'):
-            self.perform_confirm_delete()
-        elif event.button.id.startswith('ctx-'):
-            # context menu actions
-            parts = event.button.id.split('-')
-            action = parts[1]
-            cid = '-'.join(parts[2:])
-            if action == 'rename':
-                self.hide_conv_context()
-                self.select_conversation(cid)
-                self.start_rename()
-            elif action == 'delete':
-                self.hide_conv_context()
-                self.show_delete_confirm('conv', cid)
-            elif action == 'export':
-                self.hide_conv_context()
-                self.export_conversation(cid)
-            elif action == 'cancel':
-                self.hide_conv_context()
-        elif event.button.id.startswith('compare-'):
-            # Compare button pressed for a grouped turn
-            turn_id = event.button.id.split('compare-')[1]
-            threading.Thread(target=lambda: self.handle_compare(turn_id), daemon=True).start()
-        elif event.button.id.startswith('comparepair-'):
-            # Compare pair request: comparepair-<turn>-<m1>-<m2>
-            parts = event.button.id.split('-')
-            turn_id = parts[1]
-            m1 = parts[2]
-            m2 = parts[3]
-            threading.Thread(target=lambda: self.handle_compare(turn_id, m1, m2), daemon=True).start()
-        elif event.button.id == "cancel-rename":
-            # remove rename input if present
-            try:
-                for child in list(getattr(self.query_one('#conversations'), 'children', [])):
+
+            # Send to each selected model (concurrently via work) and pass turn_id
+            for mod in models_to_send:
+                try:
+                    self.get_ai_response(user_text, mod, turn_id=turn_id)
+                except Exception:
                     try:
-                        if getattr(child, 'id', '') in ('rename-input',):
-                            child.remove()
+                        self._chat_box().mount(Label(f'Error scheduling send to {mod}', classes='error-msg'))
                     except Exception:
                         pass
-            except Exception:
-                pass
-        elif event.button.id == "export-conv":
-            if self._current_conv_id:
-                self.export_conversation(self._current_conv_id)
-        elif event.button.id == "import-conv":
-            # show a simple in-app file picker to import conversation JSONs
-            self.show_import_picker()
-        elif event.button.id == 'cancel-import':
-            try:
-                self.query_one('#import-picker').remove()
-            except Exception:
-                pass
-        elif event.button.id.startswith('pick-'):
-            # figure out original filename from sanitized id
-            sid = event.button.id.split('pick-')[1]
-            try:
-                p = Path(__file__).resolve().parent
-                files = [x for x in p.glob('*.json')]
-                target = None
-                for f in files:
-                    if self._sanitize_id(f.name) == sid:
-                        target = f
-                        break
-                if target:
-                    self.import_conversation(str(target))
-                else:
-                    self.query_one('#chat-history').mount(Label('Error: file not found.', classes='error-msg'))
-            except Exception as e:
-                try:
-                    self.query_one('#chat-history').mount(Label(f'Import error: {e}', classes='error-msg'))
-                except Exception:
-                    pass
-            try:
-                self.query_one('#import-picker').remove()
-            except Exception:
-                pass
-        elif event.button.id.startswith('conv-'):
-            cid = event.button.id.split('conv-')[1]
-            self.select_conversation(cid)
-        elif event.button.id == "append-summary":
-            # Append the last generated summary to input
-            inp = self.query_one("#user-input")
-            inp.value = (inp.value or "") + "\n\n" + (getattr(self, "_last_summary", "") or "")
-            for w in getattr(self, "_last_summary_widgets", []):
-                try:
-                    w.remove()
-                except Exception:
-                    pass
-            self._last_summary_widgets = []
-            self.query_one("#chat-history").mount(Label("System: Appended summary to input.", classes="system-msg"))
-        elif event.button.id == "replace-summary":
-            inp = self.query_one("#user-input")
-            inp.value = getattr(self, "_last_summary", "") or ""
-            for w in getattr(self, "_last_summary_widgets", []):
+            inp.value = ""
+
+    def _handle_create_conv(self, button_id: str):
+        self.create_conversation()
+
+    def _handle_delete_conv(self, button_id: str):
+        if self._current_conv_id:
+            # show confirmation first
+            self.show_delete_confirm('conv', self._current_conv_id)
+
+    def _handle_rename_conv(self, button_id: str):
+        self.start_rename()
+
+    def _handle_save_rename(self, button_id: str):
+        try:
+            inp = self.query_one('#rename-input')
+            new_title = inp.value
+            # cleanup rename widgets
+            for child in list(getattr(self.query_one('#conversations'), 'children', [])):
                 try:
-                    w.remove()
+                    if getattr(child, 'id', '') in ('rename-input',):
+                        child.remove()
                 except Exception:
                     pass
-            self._last_summary_widgets = []
-            self.query_one("#chat-history").mount(Label("System: Replaced input with summary.", classes="system-msg"))
-        elif event.button.id == "cancel-summary":
-            for w in getattr(self, "_last_summary_widgets", []):
+            for child in list(getattr(self.query_one('#conversations'), 'children', [])):
                 try:
-                    w.remove()
+                    # remove the Horizontal buttons group too if present
+                    if isinstance(child, type(self.query_one('#conversations'))):
+                        pass
                 except Exception:
                     pass
-            self._last_summary_widgets = []
-            self.query_one("#chat-history").mount(Label("System: Summary preview canceled.", classes="system-msg"))
-        elif event.button.id == "edit-summary":
-            chat_box = self.query_one("#chat-history")
-            summary = getattr(self, "_last_summary", "") or ""
-            if TextArea:
-                editor = TextArea(value=summary, id="summary-editor")
-            else:
-                editor = Input(value=summary, id="summary-editor")
-                chat_box.mount(Label("Note: editor is single-line fallback.", classes="system-msg"))
-            edit_btns = Horizontal()
-            edit_btns.mount(Button("Save Edits", id="save-summary-edit"))
-            edit_btns.mount(Button("Cancel Edit", id="cancel-edit"))
-            chat_box.mount(editor)
-            chat_box.mount(edit_btns)
-            self._last_summary_widgets.extend([editor, edit_btns])
-            chat_box.mount(Label("System: Edit the summary and click Save.", classes="system-msg"))
-        elif event.button.id == "save-summary-edit":
-            # Save edited summary and update preview
-            try:
-                editor = self.query_one("#summary-editor")
-                new_summary = getattr(editor, "value", None) or ""
-                if hasattr(editor, "get_value"):
+        except Exception:
+            new_title = None
+        if new_title:
+            self.finish_rename(new_title)
+
+    def _handle_agent_build(self, button_id: str):
+        try:
+            self._chat_box().mount(Label('System: Build agent triggered (mock).', classes='system-msg'))
+        except Exception:
+            pass
+
+    def _handle_agent_test(self, button_id: str):
+        try:
+            self._chat_box().mount(Label('System: Test agent triggered (mock).', classes='system-msg'))
+        except Exception:
+            pass
+
+    def _handle_refresh_models(self, button_id: str):
+        self.refresh_models_panel()
+
+    def _handle_pull_model(self, button_id: str):
+        s = button_id.split('pull-')[1]
+        # find model by sanitized name
+        models = self.list_models()
+        for m in models:
+            name = m.get('name') or str(m)
+            if self._sanitize_id(name) == s:
+                self.pull_model(name)
+                # refresh the panel after some delay
+                threading.Thread(target=lambda: (time.sleep(0.5), self.refresh_models_panel()), daemon=True).start()
+                break
+
+    def _handle_select_model(self, button_id: str):
+        s = button_id.split('select-')[1]
+        models = self.list_models()
+        for m in models:
+            name = m.get('name') or str(m)
+            if self._sanitize_id(name) == s:
+                if name in self._selected_models:
+                    self._selected_models.remove(name)
                     try:
-                        new_summary = editor.get_value()
+                        btn = self.query_one(f"#select-{s}")
+                        btn.update('Include')
                     except Exception:
                         pass
-            except Exception:
-                new_summary = getattr(self, "_last_summary", "") or ""
-            self._last_summary = new_summary
-            # Update the preview Markdown widget
-            for w in list(getattr(self, "_last_summary_widgets", [])):
-                if isinstance(w, Markdown):
+                else:
+                    self._selected_models.add(name)
                     try:
-                        w.update(f"**Summary preview**\n\n{new_summary}")
+                        btn = self.query_one(f"#select-{s}")
+                        btn.update('Included')
                     except Exception:
                         pass
-            # Remove editor widgets
-            for w in list(self._last_summary_widgets):
+                break
+
+    def _handle_select_all_models(self, button_id: str):
+        # select all available models
+        try:
+            models = self.list_models()
+            for m in models:
+                name = m.get('name') or str(m)
+                self._selected_models.add(name)
+            self.refresh_models_panel()
+        except Exception:
+            pass
+
+    def _handle_delete_model(self, button_id: str):
+        s = button_id.split('delete-')[1]
+        models = self.list_models()
+        for m in models:
+            name = m.get('name') or str(m)
+            if self._sanitize_id(name) == s:
+                self.show_delete_confirm('model', name)
+                break
+
+    def _handle_use_model(self, button_id: str):
+        s = button_id.split('use-')[1]
+        models = self.list_models()
+        for m in models:
+            name = m.get('name') or str(m)
+            if self._sanitize_id(name) == s:
+                self.set_conversation_model(name)
+                break
+
+    def _handle_cancel_delete(self, button_id: str):
+        self.cancel_delete_confirm()
+
+    def _handle_confirm_delete(self, button_id: str):
+        self.perform_confirm_delete()
+
+    def _handle_conv_context(self, button_id: str):
+        # context menu actions
+        parts = button_id.split('-')
+        action = parts[1]
+        cid = '-'.join(parts[2:])
+        if action == 'rename':
+            self.hide_conv_context()
+            self.select_conversation(cid)
+            self.start_rename()
+        elif action == 'delete':
+            self.hide_conv_context()
+            self.show_delete_confirm('conv', cid)
+        elif action == 'export':
+            self.hide_conv_context()
+            self.export_conversation(cid)
+        elif action == 'cancel':
+            self.hide_conv_context()
+
+    def _handle_compare_turn(self, button_id: str):
+        # Compare button pressed for a grouped turn
+        turn_id = button_id.split('compare-')[1]
+        threading.Thread(target=lambda: self.handle_compare(turn_id), daemon=True).start()
+
+    def _handle_compare_pair(self, button_id: str):
+        # Compare pair request: comparepair-<turn>-<m1>-<m2>
+        parts = button_id.split('-')
+        turn_id = parts[1]
+        m1 = parts[2]
+        m2 = parts[3]
+        threading.Thread(target=lambda: self.handle_compare(turn_id, m1, m2), daemon=True).start()
+
+    def _handle_cancel_rename(self, button_id: str):
+        # remove rename input if present
+        try:
+            for child in list(getattr(self.query_one('#conversations'), 'children', [])):
                 try:
-                    if getattr(w, "id", "") == "summary-editor":
-                        w.remove()
-                        self._last_summary_widgets.remove(w)
-                    if isinstance(w, Horizontal):
-                        # Check its children button ids
-                        wids = []
-                        try:
-                            for child in getattr(w, "children", []):
-                                wids.append(getattr(child, "id", None))
-                        except Exception:
-                            pass
-                        if "save-summary-edit" in wids or "cancel-edit" in wids:
-                            try:
-                                w.remove()
-                                self._last_summary_widgets.remove(w)
-                            except Exception:
-                                pass
+                    if getattr(child, 'id', '') in ('rename-input',):
+                        child.remove()
                 except Exception:
                     pass
-            self.query_one("#chat-history").mount(Label("System: Saved edited summary.", classes="system-msg"))
-        elif event.button.id == "cancel-edit":
-            for w in list(getattr(self, "_last_summary_widgets", [])):
+        except Exception:
+            pass
+
+    def _handle_export_conv(self, button_id: str):
+        if self._current_conv_id:
+            self.export_conversation(self._current_conv_id)
+
+    def _handle_import_conv(self, button_id: str):
+        # show a simple in-app file picker to import conversation JSONs
+        self.show_import_picker()
+
+    def _handle_cancel_import(self, button_id: str):
+        self.query('#import-picker').remove()
+
+    def _handle_pick_import(self, button_id: str):
+        # figure out original filename from sanitized id
+        sid = button_id.split('pick-')[1]
+        try:
+            p = Path(__file__).resolve().parent
+            files = [x for x in p.glob('*.json')]
+            target = None
+            for f in files:
+                if self._sanitize_id(f.name) == sid:
+                    target = f
+                    break
+            if target:
+                self.import_conversation(str(target))
+            else:
+                self._chat_box().mount(Label('Error: file not found.', classes='error-msg'))
+        except Exception as e:
+            try:
+                self._chat_box().mount(Label(f'Import error: {e}', classes='error-msg'))
+            except Exception:
+                pass
+        self.query('#import-picker').remove()
+
+    def _handle_select_conversation(self, button_id: str):
+        cid = button_id.split('conv-')[1]
+        self.select_conversation(cid)
+
+    def _handle_append_summary(self, button_id: str):
+        # Append the last generated summary to input
+        inp = self._input_box()
+        inp.value = (inp.value or "") + "\n\n" + (getattr(self, "_last_summary", "") or "")
+        for w in self._last_summary_widgets.values():
+            w.remove()
+        self._last_summary_widgets = {}
+        self._chat_box().mount(Label("System: Appended summary to input.", classes="system-msg"))
+
+    def _handle_replace_summary(self, button_id: str):
+        inp = self._input_box()
+        inp.value = getattr(self, "_last_summary", "") or ""
+        for w in self._last_summary_widgets.values():
+            w.remove()
+        self._last_summary_widgets = {}
+        self._chat_box().mount(Label("System: Replaced input with summary.", classes="system-msg"))
+
+    def _handle_cancel_summary(self, button_id: str):
+        for w in self._last_summary_widgets.values():
+            w.remove()
+        self._last_summary_widgets = {}
+        self._chat_box().mount(Label("System: Summary preview canceled.", classes="system-msg"))
+
+    def _handle_edit_summary(self, button_id: str):
+        chat_box = self._chat_box()
+        summary = getattr(self, "_last_summary", "") or ""
+        if TextArea:
+            editor = TextArea(value=summary, id="summary-editor")
+        else:
+            editor = Input(value=summary, id="summary-editor")
+            chat_box.mount(Label("Note: editor is single-line fallback.", classes="system-msg"))
+        edit_btns = Horizontal(
+            Button("Save Edits", id="save-summary-edit"),
+            Button("Cancel Edit", id="cancel-edit"),
+        )
+        chat_box.mount(editor)
+        chat_box.mount(edit_btns)
+        self._last_summary_widgets["editor"] = editor
+        self._last_summary_widgets["edit_btns"] = edit_btns
+        chat_box.mount(Label("System: Edit the summary and click Save.", classes="system-msg"))
+
+    def _handle_save_summary_edit(self, button_id: str):
+        # Save edited summary and update preview
+        try:
+            editor = self.query_one("#summary-editor")
+            new_summary = getattr(editor, "value", None) or ""
+            if hasattr(editor, "get_value"):
                 try:
-                    if getattr(w, "id", "") == "summary-editor":
-                        w.remove()
-                        self._last_summary_widgets.remove(w)
-                    if isinstance(w, Horizontal):
-                        # maybe it's edit btns
-                        wids=[]
-                        try:
-                            for child in getattr(w, "children", []):
-                                wids.append(getattr(child, "id", None))
-                        except Exception:
-                            pass
-                        if "save-summary-edit" in wids or "cancel-edit" in wids:
-                            try:
-                                w.remove()
-                                self._last_summary_widgets.remove(w)
-                            except Exception:
-                                pass
+                    new_summary = editor.get_value()
                 except Exception:
                     pass
-            self.query_one("#chat-history").mount(Label("System: Edit canceled.", classes="system-msg"))
+        except Exception:
+            new_summary = getattr(self, "_last_summary", "") or ""
+        self._last_summary = new_summary
+        # Update the preview Markdown widget
+        preview = self._last_summary_widgets.get("preview")
+        if preview is not None:
+            preview.update(f"**Summary preview**\n\n{new_summary}")
+        # Remove editor widgets
+        for key in ("editor", "edit_btns"):
+            w = self._last_summary_widgets.pop(key, None)
+            if w is not None:
+                w.remove()
+        self._chat_box().mount(Label("System: Saved edited summary.", classes="system-msg"))
+
+    def _handle_cancel_edit(self, button_id: str):
+        for key in ("editor", "edit_btns"):
+            w = self._last_summary_widgets.pop(key, None)
+            if w is not None:
+                w.remove()
+        self._chat_box().mount(Label("System: Edit canceled.", classes="system-msg"))
+
+    _BUTTON_HANDLERS = {
+        "tab-home": _handle_tab_home,
+        "tab-chat": _handle_tab_chat,
+        "send-btn": _handle_send,
+        "btn-yt": _handle_pull_transcript,
+        "send-selected": _handle_send_selected,
+        "create-conv": _handle_create_conv,
+        "delete-conv": _handle_delete_conv,
+        "rename-conv": _handle_rename_conv,
+        "save-rename": _handle_save_rename,
+        "agent-build": _handle_agent_build,
+        "agent-test": _handle_agent_test,
+        "refresh-models": _handle_refresh_models,
+        "select-all-models": _handle_select_all_models,
+        "cancel-delete": _handle_cancel_delete,
+        "cancel-rename": _handle_cancel_rename,
+        "export-conv": _handle_export_conv,
+        "import-conv": _handle_import_conv,
+        "cancel-import": _handle_cancel_import,
+        "append-summary": _handle_append_summary,
+        "replace-summary": _handle_replace_summary,
+        "cancel-summary": _handle_cancel_summary,
+        "edit-summary": _handle_edit_summary,
+        "save-summary-edit": _handle_save_summary_edit,
+        "cancel-edit": _handle_cancel_edit,
+    }
+
+    # Checked in order; "conv-" first as the common case.
+    _BUTTON_PREFIX_HANDLERS = (
+        ("conv-", _handle_select_conversation),
+        ("pull-", _handle_pull_model),
+        ("select-", _handle_select_model),
+        ("delete-", _handle_delete_model),
+        ("use-", _handle_use_model),
+        ("confirm-delete-", _handle_confirm_delete),
+        ("ctx-", _handle_conv_context),
+        ("compare-", _handle_compare_turn),
+        ("comparepair-", _handle_compare_pair),
+        ("pick-", _handle_pick_import),
+    )
 
     def _set_compact_labels(self, compact: bool):
         labels = {
@@ -2056,15 +2049,25 @@ Button.-primary:hover {
             'btn-yt': ('Pull Transcript', 'Transcript'),
         }
         for wid, (full, short) in labels.items():
-            try:
-                self.query_one(f'#{wid}').label = short if compact else full
-            except Exception:
-                pass
+            for btn in self.query(f'#{wid}'):
+                btn.label = short if compact else full
 
     def on_resize(self, event):
+        # Collapse bursts of resize events (window drags) into one update
+        # (resize can arrive before on_mount has set up state)
+        timer = getattr(self, '_resize_timer', None)
+        if timer is not None:
+            timer.stop()
+        self._resize_timer = self.set_timer(0.05, self._apply_compact_labels)
+
+    def _apply_compact_labels(self):
+        self._resize_timer = None
         try:
-            width = getattr(event, 'width', None) or getattr(self.size, 'width', 120)
-            self._set_compact_labels(width < 110)
+            compact = getattr(self.size, 'width', 120) < 110
+            if compact == getattr(self, '_compact_state', None):
+                return
+            self._set_compact_labels(compact)
+            self._compact_state = compact
         except Exception:
             pass
 
@@ -2089,10 +2092,7 @@ Button.-primary:hover {
                 pass
             return
         if k == 'ctrl+f':
-            try:
-                self.query_one('#conv-search').focus()
-            except Exception:
-                pass
+            self.query('#conv-search').focus()
             return
         if k == 'ctrl+x':
             self._awaiting_editor_key = True
@@ -2101,12 +2101,14 @@ Button.-primary:hover {
             except Exception:
                 pass
             # clear after timeout
-            def _clear():
-                time.sleep(4)
-                self._awaiting_editor_key = False
-            threading.Thread(target=_clear, daemon=True).start()
+            if self._editor_timer is not None:
+                self._editor_timer.stop()
+            self._editor_timer = self.set_timer(4.0, lambda: setattr(self, "_awaiting_editor_key", False))
             return
         if self._awaiting_editor_key and k and k.lower() == 'e':
             self._awaiting_editor_key = False
+            if self._editor_timer is not None:
+                self._editor_timer.stop()
+                self._editor_timer = None
             self.open_external_editor()
             return
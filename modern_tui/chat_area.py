@@ -1,24 +1,77 @@
 """
 ChatArea widget for displaying and managing conversation messages.
 Inspired by OpenCode's session/index.tsx route component pattern.
+
+Messages are virtualized: only the rows intersecting the viewport (plus a
+small overscan) are mounted, and spacer widgets stand in for the rest.
 """
 
+import re
+from bisect import bisect_left, bisect_right
+from itertools import accumulate
+from textual.timer import Timer
+from textual.widget import Widget
 from textual.widgets import Static, Markdown, Label
 from textual.containers import Vertical, Horizontal, ScrollableContainer
-from typing import Optional, Callable
+from typing import Optional, Callable, Dict, List, Tuple
 from datetime import datetime
 
 from .conversation_manager import ConversationManager, Conversation, Message
 from .chat_message import ChatMessage
 
 
+# Estimated rendered height (in rows) of a message, by role. Used to size the
+# spacers that stand in for messages outside the rendered window.
+ROW_HEIGHTS = {"user": 2, "assistant": 4, "system": 1}
+
+# Characters that suggest an assistant reply needs Markdown rendering. Replies
+# without any of these (and not too long) are shown as a plain Label.
+_MD_SNIFF = re.compile(r"[`*_#>\[\]!]|\n\n")
+_PLAIN_MAX_LEN = 2000
+
+
+def _is_plain(msg: Message) -> bool:
+    """Return True if ``msg`` can be shown without Markdown (cached on msg)."""
+    plain = getattr(msg, "_is_plain", None)
+    if plain is None:
+        content = msg.content or ""
+        plain = len(content) <= _PLAIN_MAX_LEN and _MD_SNIFF.search(content) is None
+        msg._is_plain = plain
+    return plain
+
+
+def _ts_hm(msg: Message) -> str:
+    """Return the message's ``%H:%M`` timestamp (cached on msg)."""
+    formatted = getattr(msg, "_ts_hm", None)
+    if formatted is None:
+        formatted = msg.timestamp.strftime("%H:%M")
+        msg._ts_hm = formatted
+    return formatted
+
+
 class ChatArea(Static):
     """Main chat display area with message history and scrolling."""
 
+    DEFAULT_CSS = """
+    ChatArea {
+        height: 1fr;
+    }
+
+    ChatArea > .chat-scroll {
+        height: 100%;
+    }
+
+    ChatArea .msg-container {
+        height: auto;
+    }
+    """
+
     def __init__(
         self,
         manager: ConversationManager,
         conv_id: Optional[str] = None,
+        max_rendered: int = 50,
+        overscan: int = 3,
         **kwargs,
     ):
         super().__init__(**kwargs)
@@ -26,25 +79,102 @@ class ChatArea(Static):
         self.conv_id = conv_id
         self.current_conversation: Optional[Conversation] = None
 
+        # Virtual scrolling state
+        self.max_rendered = max_rendered
+        self.overscan = overscan
+        self.visible_start = 0
+        self.visible_end = 0
+        self._row_heights: Dict[str, int] = dict(ROW_HEIGHTS)
+        self._offsets: List[int] = [0]  # prefix sums of row heights
+        self._measured: Dict[int, int] = {}  # real heights of rows seen on screen
+        self._rendered: Dict[int, Widget] = {}
+        # Rows waiting to be mounted in one batch by _flush_pending
+        self._pending_mounts: List[Widget] = []
+        # Markdown bodies mounted empty, filled in by a worker once mounted
+        self._pending_markdown: List[Tuple[Markdown, str]] = []
+        self._flush_timer: Optional[Timer] = None
+        # Markdown loaders still running, and whether a freshly loaded
+        # conversation should be pinned to its last row once they settle
+        self._markdown_loads = 0
+        self._stick_to_end = False
+        self._top_spacer = Static("", classes="chat-spacer")
+        self._bottom_spacer = Static("", classes="chat-spacer")
+        self._scroller = ScrollableContainer(
+            self._top_spacer, self._bottom_spacer, classes="chat-scroll"
+        )
+
+    def compose(self):
+        yield self._scroller
+
     def on_mount(self):
         """Load initial conversation when mounted."""
+        self.watch(self._scroller, "scroll_y", self._on_scroll_y, init=False)
         if self.conv_id:
             self.load_conversation(self.conv_id)
 
+    def on_resize(self, event):
+        """Viewport height changed; recompute which rows should be mounted."""
+        self._update_window()
+
+    def _on_scroll_y(self, scroll_y: float):
+        if scroll_y < self._scroller.max_scroll_y:
+            # Scrolled away from the end; stop pulling the view back there
+            self._stick_to_end = False
+        self._update_window()
+
     def load_conversation(self, conv_id: str):
         """Load and render a conversation."""
         self.conv_id = conv_id
         self.current_conversation = self.manager.get(conv_id)
+        # The offsets belong to the previous conversation; start from the
+        # top so the first window is computed against the new rows.
+        self._scroller.scroll_home(animate=False, immediate=True)
         self._render_messages()
+        # Estimated heights put the end in the wrong place; _settle_window
+        # scrolls there again once the mounted rows have been measured.
+        self._stick_to_end = bool(
+            self.current_conversation and self.current_conversation.messages
+        )
+
+    def _row_height(self, index: int, msg: Message) -> int:
+        height = self._measured.get(index)
+        return height if height is not None else self._row_heights.get(msg.role, 1)
+
+    def _measure_rendered(self, messages: List[Message]) -> None:
+        """Replace estimates with the real heights of mounted rows."""
+        changed = False
+        for i, widget in self._rendered.items():
+            if widget.parent is None:
+                continue
+            height = widget.outer_size.height + widget.styles.margin.height
+            if not height or self._measured.get(i) == height:
+                continue
+            self._measured[i] = height
+            self._row_heights[messages[i].role] = height
+            changed = True
+        if changed:
+            self._offsets = [
+                0, *accumulate(self._row_height(i, m) for i, m in enumerate(messages))
+            ]
 
     def _render_messages(self):
-        """Clear and re-render all messages for current conversation."""
-        # Clear existing children
-        for child in list(self.children):
-            try:
-                child.remove()
-            except Exception:
-                pass
+        """Reset the virtual window and render the rows currently in view."""
+        # Clear existing message widgets (spacers stay mounted)
+        self._scroller.remove_children(
+            [
+                child
+                for child in self._scroller.children
+                if child is not self._top_spacer and child is not self._bottom_spacer
+            ]
+        )
+        self._pending_mounts = []
+        self._pending_markdown = []
+        self._rendered = {}
+        self._measured = {}
+        self._offsets = [0]
+        self.visible_start = self.visible_end = 0
+        self._top_spacer.styles.height = 0
+        self._bottom_spacer.styles.height = 0
 
         if not self.current_conversation:
             return
@@ -53,82 +183,180 @@ class ChatArea(Static):
         if not messages:
             # Show placeholder
             try:
-                self.mount(Label("No messages yet. Start a conversation!", id="chat-empty"))
+                self._scroller.mount(
+                    Label("No messages yet. Start a conversation!", id="chat-empty"),
+                    before=self._bottom_spacer,
+                )
             except Exception:
                 pass
             return
 
-        # Render each message with proper styling
-        for msg in messages:
-            self._render_message(msg)
+        self._offsets = [
+            0, *accumulate(self._row_height(i, m) for i, m in enumerate(messages))
+        ]
+        self._update_window()
+
+    def _update_window(self):
+        """Mount rows entering the viewport and remove rows that left it."""
+        if not self.current_conversation or not self.is_mounted:
+            return
+        messages = self.current_conversation.messages
+        total = len(messages)
+        if not total:
+            return
+
+        self._measure_rendered(messages)
+        top = int(self._scroller.scroll_y)
+        viewport = self._scroller.size.height or self.app.size.height
+        start = min(total - 1, bisect_right(self._offsets, top) - 1)
+        end = bisect_left(self._offsets, top + viewport, lo=start + 1)
+        start = max(0, start - self.overscan)
+        end = min(total, end + self.overscan, start + self.max_rendered)
 
-    def _render_message(self, msg: Message):
-        """Render a single message."""
+        # Rows still waiting in _pending_mounts have no parent; dropping them
+        # from _rendered is enough for _flush_pending to skip them.
+        leaving = [self._rendered.pop(i) for i in list(self._rendered) if not start <= i < end]
+        self._scroller.remove_children([w for w in leaving if w.parent is not None])
+
+        for i in range(start, end):
+            if i in self._rendered:
+                continue
+            widget = self._render_message(messages[i])
+            if widget is not None:
+                self._rendered[i] = widget
+
+        self.visible_start, self.visible_end = start, end
+        self._size_spacers()
+
+    def _size_spacers(self):
+        """Size the spacers to cover every row that is not mounted yet."""
+        mounted = [i for i, w in self._rendered.items() if w.parent is not None]
+        if mounted:
+            first, last = min(mounted), max(mounted) + 1
+        else:
+            first = last = self.visible_start
+        self._top_spacer.styles.height = self._offsets[first]
+        self._bottom_spacer.styles.height = self._offsets[-1] - self._offsets[last]
+
+    def _schedule_flush(self):
+        """Arm the flush timer so a burst of rows mounts in one pass."""
+        if self._flush_timer is None:
+            self._flush_timer = self.set_timer(0.05, self._flush_pending)
+
+    def _flush_pending(self):
+        """Mount all pending rows, one mount_all call per insertion point."""
+        self._flush_timer = None
+        pending = {id(w) for w in self._pending_mounts}
+        self._pending_mounts = []
+        markdown, self._pending_markdown = self._pending_markdown, []
+        if not pending:
+            return
+
+        # Rows that left the window before the flush are no longer in _rendered.
+        rows = sorted(
+            (i, w) for i, w in self._rendered.items() if id(w) in pending
+        )
+        mounted = sorted(i for i, w in self._rendered.items() if id(w) not in pending)
+
+        batch: List[Widget] = []
+        anchor: Optional[Widget] = None
+        mounts = []
+        for i, widget in rows:
+            # Insert before the next already-mounted row to keep message order
+            pos = bisect_right(mounted, i)
+            row_anchor = self._rendered[mounted[pos]] if pos < len(mounted) else self._bottom_spacer
+            if batch and row_anchor is not anchor:
+                mounts.append(self._scroller.mount_all(batch, before=anchor))
+                batch = []
+            anchor = row_anchor
+            batch.append(widget)
+        if batch:
+            mounts.append(self._scroller.mount_all(batch, before=anchor))
+        self._size_spacers()
+        if markdown:
+            self._markdown_loads += 1
+            self.run_worker(self._load_markdown(mounts, markdown), group="markdown", exclusive=False, exit_on_error=False)
+        # Measure the new rows once laid out and settle the window
+        self.call_after_refresh(self._settle_window)
+
+    def _settle_window(self):
+        """Re-measure the window and keep a just-loaded conversation at its end."""
+        self._update_window()
+        if not self._stick_to_end:
+            return
+        self._scroller.scroll_end(animate=False, immediate=True)
+        # Scrolling may have queued more rows; their flush settles again.
+        if not self._pending_mounts and not self._markdown_loads:
+            self._stick_to_end = False
+
+    async def _load_markdown(self, mounts, markdown: List[Tuple[Markdown, str]]):
+        """Fill Markdown bodies once their rows are mounted.
+
+        Markdown.update parses off the UI thread, so large replies appear
+        as soon as they are laid out instead of blocking the first paint.
+        """
+        try:
+            for awaitable in mounts:
+                await awaitable
+            for md, content in markdown:
+                # Rows that scrolled out of the window meanwhile are skipped
+                if md.is_mounted:
+                    await md.update(content)
+        finally:
+            self._markdown_loads -= 1
+        # The rows have grown from their placeholder height; re-measure
+        self.call_after_refresh(self._settle_window)
+
+    def _render_message(self, msg: Message) -> Optional[Widget]:
+        """Build a single message widget and queue it for mounting."""
         try:
             if msg.role == "assistant":
-                # Render assistant response as Markdown for rich formatting
-                container = Vertical(classes=f"msg-container msg-{msg.role}")
-                
                 # Header: model name + timestamp
                 header_text = msg.model or "Assistant"
                 if msg.timestamp:
-                    header_text += f" • {msg.timestamp.strftime('%H:%M')}"
-                
-                try:
-                    container.mount(
-                        Label(header_text, classes=f"msg-header msg-{msg.role}")
-                    )
-                except Exception:
-                    pass
-
-                # Content
-                try:
-                    container.mount(
-                        Markdown(msg.content, classes=f"msg-content msg-{msg.role}")
-                    )
-                except Exception:
-                    pass
-
-                self.mount(container)
+                    header_text += f" • {_ts_hm(msg)}"
+
+                # Render assistant response as Markdown for rich formatting,
+                # unless it is plain text that a Label can lay out directly
+                if _is_plain(msg):
+                    body = Label(msg.content, classes=f"msg-content msg-{msg.role}")
+                else:
+                    # Mounted empty; _flush_pending hands the content to
+                    # _load_markdown once the row is mounted
+                    body = Markdown(classes=f"msg-content msg-{msg.role}")
+                    self._pending_markdown.append((body, msg.content))
+                container = Vertical(
+                    Label(header_text, classes=f"msg-header msg-{msg.role}"),
+                    body,
+                    classes=f"msg-container msg-{msg.role}",
+                )
 
             elif msg.role == "user":
-                # Render user message as simple text
-                container = Vertical(classes=f"msg-container msg-{msg.role}")
-                
                 header = "You"
                 if msg.timestamp:
-                    header += f" • {msg.timestamp.strftime('%H:%M')}"
-                
-                try:
-                    container.mount(
-                        Label(header, classes=f"msg-header msg-{msg.role}")
-                    )
-                except Exception:
-                    pass
-
-                try:
-                    container.mount(
-                        Label(msg.content, classes=f"msg-content msg-{msg.role}")
-                    )
-                except Exception:
-                    pass
-
-                self.mount(container)
+                    header += f" • {_ts_hm(msg)}"
+
+                # Render user message as simple text
+                container = Vertical(
+                    Label(header, classes=f"msg-header msg-{msg.role}"),
+                    Label(msg.content, classes=f"msg-content msg-{msg.role}"),
+                    classes=f"msg-container msg-{msg.role}",
+                )
 
             else:
                 # System message
-                try:
-                    self.mount(
-                        Label(
-                            f"[System] {msg.content}",
-                            classes=f"msg-system msg-{msg.role}",
-                        )
-                    )
-                except Exception:
-                    pass
+                container = Label(
+                    f"[System] {msg.content}",
+                    classes=f"msg-system msg-{msg.role}",
+                )
+
+            self._pending_mounts.append(container)
+            self._schedule_flush()
+            return container
 
         except Exception as e:
             print(f"Error rendering message: {e}")
+            return None
 
     def add_message(
         self,
@@ -143,29 +371,50 @@ class ChatArea(Static):
         msg = self.manager.add_message(
             self.conv_id, content=content, role=role, model=model
         )
-        if msg:
-            # Reload to show new message
+        if not msg:
+            return msg
+
+        conv = self.current_conversation
+        if conv is None or conv.id != self.conv_id:
             self.load_conversation(self.conv_id)
+            return msg
+
+        # The manager usually hands back the same Conversation object, in
+        # which case the message is already in the list.
+        if not conv.messages or conv.messages[-1] is not msg:
+            conv.messages.append(msg)
+        index = len(conv.messages) - 1
+        if index == 0:
+            self._scroller.remove_children("#chat-empty")
+        self._offsets.append(self._offsets[-1] + self._row_height(index, msg))
+
+        # Only the new row is rendered; it mounts if it falls in the window.
+        self._update_window()
+        self.scroll_to_bottom()
         return msg
 
     def clear_messages(self):
         """Clear all messages from display (without deleting from storage)."""
-        for child in list(self.children):
-            try:
-                child.remove()
-            except Exception:
-                pass
+        self._scroller.remove_children(
+            [
+                child
+                for child in self._scroller.children
+                if child is not self._top_spacer and child is not self._bottom_spacer
+            ]
+        )
+        self._pending_mounts = []
+        self._pending_markdown = []
+        self.current_conversation = None
+        self._stick_to_end = False
+        self._rendered = {}
+        self.visible_start = self.visible_end = 0
+        self._top_spacer.styles.height = 0
+        self._bottom_spacer.styles.height = 0
 
     def scroll_to_bottom(self):
         """Scroll to the bottom of the chat area."""
         try:
-            # Find parent ScrollableContainer and scroll
-            parent = self.parent
-            while parent:
-                if isinstance(parent, ScrollableContainer):
-                    parent.scroll_end(animate=True)
-                    break
-                parent = parent.parent
+            self._scroller.scroll_end(animate=True)
         except Exception:
             pass
 
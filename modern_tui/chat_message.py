@@ -7,9 +7,24 @@ from textual.widgets import Static, Label
 from textual.containers import Vertical, Horizontal
 from textual.reactive import reactive
 from datetime import datetime
+from functools import lru_cache
+from types import MappingProxyType
 from typing import Optional
 
 
+# Role display tables, shared by every message. A ``None`` label means the
+# model name (or "Assistant") is used instead.
+_ROLE_LABELS = MappingProxyType({"user": "You", "assistant": None, "system": "System"})
+_ROLE_COLORS = MappingProxyType({"user": "#e6e6e6", "assistant": "#7aa2f7", "system": "#f2a65a"})
+_DEFAULT_COLOR = "#e6e6e6"
+
+
+@lru_cache(maxsize=1024)
+def _ts_hms(timestamp: datetime) -> str:
+    """Format a message timestamp; memoized since messages are re-created on redraw."""
+    return timestamp.strftime("%H:%M:%S")
+
+
 class ChatMessage(Static):
     """Renders a single message from a conversation with role-based styling and metadata."""
 
@@ -18,6 +33,9 @@ class ChatMessage(Static):
     model = reactive("")
     timestamp = reactive("")
 
+    _ROLE_LABELS = _ROLE_LABELS
+    _ROLE_COLORS = _ROLE_COLORS
+
     def __init__(
         self,
         content: str,
@@ -26,55 +44,43 @@ class ChatMessage(Static):
         timestamp: Optional[datetime] = None,
         **kwargs
     ):
+        self._prefix = ""
         super().__init__(**kwargs)
         self.role = role
         self.message_content = content
         self.model = model or ""
         self.timestamp = (
-            timestamp.strftime("%H:%M:%S") if timestamp else ""
+            _ts_hms(timestamp) if timestamp else ""
         )
+        self._update_prefix()
+
+    def _role_label(self) -> str:
+        label = self._ROLE_LABELS.get(self.role, self.role)
+        return label or self.model or "Assistant"
+
+    def _update_prefix(self) -> None:
+        color = self._ROLE_COLORS.get(self.role, _DEFAULT_COLOR)
+        self._prefix = f"[{color}]{self._role_label()}[/] "
+
+    def watch_role(self, role: str) -> None:
+        self._update_prefix()
+
+    def watch_model(self, model: str) -> None:
+        self._update_prefix()
 
     def render(self) -> str:
         """Render message with role-based formatting."""
-        # Format role indicator
-        role_map = {
-            "user": "You",
-            "assistant": self.model or "Assistant",
-            "system": "System",
-        }
-        role_label = role_map.get(self.role, self.role)
-
-        # Color by role
-        role_colors = {
-            "user": "#e6e6e6",
-            "assistant": "#7aa2f7",
-            "system": "#f2a65a",
-        }
-        color = role_colors.get(self.role, "#e6e6e6")
-
-        # Build timestamp suffix if present
-        timestamp_str = f" ({self.timestamp})" if self.timestamp else ""
-
-        # Format: [Role] | timestamp | content
         content_preview = self.message_content
         if isinstance(content_preview, str) and len(content_preview) > 100:
             content_preview = content_preview[:97] + "..."
-        
-        return f"[{color}]{role_label}[/] {content_preview}"
+        return self._prefix + content_preview
 
     def compose(self):
         """Compose message subcomponents (optional: for richer rendering)."""
         with Horizontal():
             # Role + timestamp header
             with Vertical():
-                role_map = {
-                    "user": "You",
-                    "assistant": self.model or "Assistant",
-                    "system": "System",
-                }
-                role_label = role_map.get(self.role, self.role)
-
-                header = f"{role_label}"
+                header = self._role_label()
                 if self.timestamp:
                     header += f" - {self.timestamp}"
 
@@ -12,6 +12,9 @@ This replaces your current chat tab with:
 Drop this into your modern_tui folder and import it!
 """
 
+from collections import deque
+from typing import Deque, Tuple
+
 from textual.app import ComposeResult
 from textual.containers import Container, Horizontal, Vertical
 from textual.widgets import Static, Input, RichLog, Button, Select
@@ -147,7 +150,7 @@ class ConversationsPanel(Container):
             yield Button("Rename", id="conv-rename-btn")
             yield Button("Delete", id="conv-delete-btn", variant="error")
 
-        yield RichLog(id="conversations-list")
+        yield RichLog(id="conversations-list", max_lines=200)
 
 
 class ChatArea(Container):
@@ -167,10 +170,26 @@ class ChatArea(Container):
     }
     """
 
+    # Queued messages are written to the log at ~30 Hz, up to this many per
+    # tick; the pump only runs while the queue has something in it
+    PUMP_INTERVAL = 1 / 30
+    PUMP_BATCH = 64
+
+    def __init__(self, *args, **kwargs) -> None:
+        super().__init__(*args, **kwargs)
+        self._msg_queue: Deque[Tuple[str, str]] = deque()
+        self._pump_timer = None
+
     def compose(self) -> ComposeResult:
         """Compose chat area."""
         yield WelcomeScreenSimple()
-        yield RichLog(id="chat-messages", classes="hidden")
+        yield RichLog(id="chat-messages", max_lines=500, classes="hidden")
+
+    def on_mount(self) -> None:
+        """Create the queue pump, paused until a message is queued."""
+        self._pump_timer = self.set_interval(
+            self.PUMP_INTERVAL, self._pump, pause=not self._msg_queue
+        )
 
     def watch_has_messages(self, has_messages: bool) -> None:
         """Toggle views."""
@@ -185,14 +204,30 @@ class ChatArea(Container):
             messages.add_class("hidden")
 
     def add_message(self, role: str, content: str) -> None:
-        """Add message and switch to message view."""
+        """Add message and switch to message view.
+
+        The message is queued; ``_pump`` writes it to the log on its next tick.
+        """
         self.has_messages = True
+        if not self._msg_queue and self._pump_timer is not None:
+            self._pump_timer.resume()
+        self._msg_queue.append((role, content))
+
+    def _pump(self) -> None:
+        """Write a batch of queued messages to the log in one update."""
+        queue = self._msg_queue
+        if not queue:
+            return
         messages = self.query_one("#chat-messages", RichLog)
-
-        if role == "user":
-            messages.write(f"[bold cyan]You:[/] {content}")
-        else:
-            messages.write(f"[bold green]IRIR:[/] {content}")
+        with self.app.batch_update():
+            for _ in range(min(len(queue), self.PUMP_BATCH)):
+                role, content = queue.popleft()
+                if role == "user":
+                    messages.write(f"[bold cyan]You:[/] {content}")
+                else:
+                    messages.write(f"[bold green]IRIR:[/] {content}")
+        if not queue:
+            self._pump_timer.pause()
 
 
 class WelcomeScreenSimple(Container):
@@ -235,12 +270,8 @@ class WelcomeScreenSimple(Container):
             yield TipDisplay()
 
 
-class LogoDisplay(Static):
-    """IRIR logo."""
-
-    def on_mount(self) -> None:
-        """Create logo."""
-        logo = """
+# Welcome/sidebar renderables are constant, so build them once at import.
+_LOGO = """
 ██╗██████╗ ██╗██████╗ 
 ██║██╔══██╗██║██╔══██╗
 ██║██████╔╝██║██████╔╝
@@ -248,9 +279,31 @@ class LogoDisplay(Static):
 ██║██║  ██║██║██║  ██║
 ╚═╝╚═╝  ╚═╝╚═╝╚═╝  ╚═╝
 """
-        text = Text(logo, justify="center")
-        text.stylize("bold cyan")
-        self.update(text)
+_LOGO_TEXT = Text(_LOGO, justify="center", style="bold cyan")
+
+_MODEL_INFO_TEXT = Text("Build", style="bold blue")
+_MODEL_INFO_TEXT.append("  Llama 3 2 3b ", style="white")
+_MODEL_INFO_TEXT.append("Ollama (local)", style="dim white")
+_MODEL_INFO_RENDERABLE = Align.center(_MODEL_INFO_TEXT)
+
+_TIP_TEXT = Text("● ", style="bold yellow")
+_TIP_TEXT.append("Tip", style="bold yellow")
+_TIP_TEXT.append(" Use ", style="dim white")
+_TIP_TEXT.append("irir run", style="bold white")
+_TIP_TEXT.append(" for non-interactive scripting", style="dim white")
+_TIP_RENDERABLE = Align.center(_TIP_TEXT)
+
+_SIDEBAR_HEADER_TEXT = Text("IRIR", style="bold cyan", justify="center")
+_SIDEBAR_HEADER_TEXT.append("\n", style="")
+_SIDEBAR_HEADER_TEXT.append("AI Assistant", style="dim white")
+
+
+class LogoDisplay(Static):
+    """IRIR logo."""
+
+    def on_mount(self) -> None:
+        """Create logo."""
+        self.update(_LOGO_TEXT)
 
 
 class ModelInfoDisplay(Static):
@@ -258,10 +311,7 @@ class ModelInfoDisplay(Static):
 
     def on_mount(self) -> None:
         """Set model info."""
-        text = Text("Build", style="bold blue")
-        text.append("  Llama 3 2 3b ", style="white")
-        text.append("Ollama (local)", style="dim white")
-        self.update(Align.center(text))
+        self.update(_MODEL_INFO_RENDERABLE)
 
 
 class TipDisplay(Static):
@@ -269,12 +319,7 @@ class TipDisplay(Static):
 
     def on_mount(self) -> None:
         """Set tip."""
-        text = Text("● ", style="bold yellow")
-        text.append("Tip", style="bold yellow")
-        text.append(" Use ", style="dim white")
-        text.append("irir run", style="bold white")
-        text.append(" for non-interactive scripting", style="dim white")
-        self.update(Align.center(text))
+        self.update(_TIP_RENDERABLE)
 
 
 class IRIRSidebar(Container):
@@ -326,10 +371,7 @@ class SidebarHeader(Static):
 
     def on_mount(self) -> None:
         """Set header."""
-        text = Text("IRIR", style="bold cyan", justify="center")
-        text.append("\n", style="")
-        text.append("AI Assistant", style="dim white")
-        self.update(text)
+        self.update(_SIDEBAR_HEADER_TEXT)
 
 
 class ContextDisplay(Container):
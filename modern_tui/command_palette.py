@@ -9,8 +9,9 @@ OpenCode-style command palette with:
 - Quick actions
 """
 
+import heapq
 from dataclasses import dataclass
-from typing import Callable, List, Optional
+from typing import Callable, Dict, List, Optional, Set, Tuple
 
 from rich.text import Text
 from textual.app import ComposeResult
@@ -36,36 +37,93 @@ class Command:
     def __post_init__(self):
         if self.keywords is None:
             self.keywords = []
+        # Lowercased search fields, computed once instead of per keystroke.
+        # Fields are joined with NUL so a query can't match across two fields.
+        self._name_lc = self.name.lower()
+        self._desc_lc = self.description.lower()
+        self._cat_lc = self.category.lower()
+        self._kw_lc = [keyword.lower() for keyword in self.keywords]
+        self._haystack = "\x00".join((self._name_lc, self._desc_lc, self._cat_lc, *self._kw_lc))
+        # Palette row renderable, built once rather than on every render
+        self._row_text = self._build_row_text()
+
+    def _build_row_text(self) -> Text:
+        text = Text()
+        text.append(self.name, style="bold white")
+        if self.shortcut:
+            text.append("  ", style="")
+            text.append(f"({self.shortcut})", style="dim cyan")
+        text.append("\n", style="")
+        text.append(self.description, style="dim white")
+        return text
 
     def matches(self, query: str) -> bool:
         """Check if command matches search query."""
-        if not query:
-            return True
+        return self.score(query) is not None
 
-        query_lower = query.lower()
-
-        if query_lower in self.name.lower():
-            return True
-        if query_lower in self.description.lower():
-            return True
-        if query_lower in self.category.lower():
-            return True
+    def score(self, query: str) -> Optional[int]:
+        """Rank this command against ``query``; None if it doesn't match.
 
-        for keyword in self.keywords:
-            if query_lower in keyword.lower():
-                return True
+        Fuzzy matches on the name are scored with ``_fuzzy_score``; commands
+        that only match as a substring of another field score 0.
+        """
+        if not query:
+            return 0
 
-        return self._fuzzy_match(query_lower, self.name.lower())
+        query_lower = query.lower()
+        score = _fuzzy_score(query_lower, self._name_lc)
+        if score is None and query_lower in self._haystack:
+            return 0
+        return score
 
     def _fuzzy_match(self, query: str, target: str) -> bool:
         """Simple fuzzy matching."""
-        query_idx = 0
-        for char in target:
-            if query_idx < len(query) and char == query[query_idx]:
-                query_idx += 1
-        return query_idx == len(query)
+        return _fuzzy_score(query, target) is not None
 
 
+def _fuzzy_score(query: str, target: str) -> Optional[int]:
+    """fzf-style subsequence score of ``query`` in ``target`` (both lowercase).
+
+    Each matched character earns +16 at the start of a word and +8 when it
+    directly follows the previous match; every skipped character costs 1.
+    Every occurrence of the first query character is tried as a starting
+    point and the best score wins. Returns None if ``query`` is not a
+    subsequence of ``target``.
+    """
+    if not query:
+        return 0
+    if len(target) < len(query):
+        return None
+    best = None
+    first = target.find(query[0])
+    while first >= 0:
+        score = _score_from(query, target, first)
+        if score is None:
+            # Later starts leave even less of the target to match
+            break
+        if best is None or score > best:
+            best = score
+        first = target.find(query[0], first + 1)
+    return best
+
+
+def _score_from(query: str, target: str, start: int) -> Optional[int]:
+    score = -start
+    pos = start
+    prev = start - 2
+    for char in query:
+        idx = target.find(char, pos)
+        if idx < 0:
+            return None
+        if idx == 0 or not target[idx - 1].isalnum():
+            score += 16
+        if idx == prev + 1:
+            score += 8
+        score -= idx - pos
+        prev = idx
+        pos = idx + 1
+    return score
+
 DEFAULT_COMMANDS = [
     Command(
         id="file.new",
@@ -204,6 +262,80 @@ DEFAULT_COMMANDS = [
 ]
 
 
+def _category_breaks(commands: List[Command]) -> Set[int]:
+    """Indices at which a new category starts in a category-grouped list."""
+    return {
+        idx
+        for idx, cmd in enumerate(commands)
+        if idx == 0 or cmd.category != commands[idx - 1].category
+    }
+
+
+
+
+class _TrieNode:
+    __slots__ = ("children", "indices")
+
+    def __init__(self):
+        self.children: Dict[str, "_TrieNode"] = {}
+        # Indices of every command with a token under this prefix
+        self.indices: Set[int] = set()
+
+
+def _build_prefix_trie(commands: List[Command]) -> _TrieNode:
+    """Index each command's name words and keywords by prefix."""
+    root = _TrieNode()
+    for idx, command in enumerate(commands):
+        for token in (*command._name_lc.split(), *command._kw_lc):
+            node = root
+            for char in token:
+                node = node.children.setdefault(char, _TrieNode())
+                node.indices.add(idx)
+    return root
+
+
+def _prefix_lookup(trie: _TrieNode, prefix: str) -> List[int]:
+    """Return indices (in command order) of commands with a token starting with prefix."""
+    node = trie
+    for char in prefix.lower():
+        node = node.children.get(char)
+        if node is None:
+            return []
+    return sorted(node.indices)
+
+
+# Command-list signature -> (category order, category breaks, prefix trie).
+# The app passes a fresh (but identical) list every time the palette opens,
+# so key on content.
+_INDEX_CACHE: Dict[tuple, Tuple[List[int], Set[int], _TrieNode]] = {}
+_INDEX_CACHE_SIZE = 8
+
+
+def _command_key(commands: List[Command]) -> tuple:
+    return tuple((cmd.id, cmd.category, cmd._haystack) for cmd in commands)
+
+
+def _index_commands(commands: List[Command]) -> Tuple[List[Command], Set[int], _TrieNode]:
+    """Group ``commands`` by category and index them for search.
+
+    Returns the grouped list (stable, so declaration order holds within a
+    category), the indices where each category starts, and the prefix trie
+    over the grouped list. The sort and trie are built once per distinct
+    command list.
+    """
+    key = _command_key(commands)
+    cached = _INDEX_CACHE.get(key)
+    if cached is None:
+        order = sorted(range(len(commands)), key=lambda idx: commands[idx].category)
+        grouped = [commands[idx] for idx in order]
+        cached = (order, _category_breaks(grouped), _build_prefix_trie(grouped))
+        if len(_INDEX_CACHE) >= _INDEX_CACHE_SIZE:
+            del _INDEX_CACHE[next(iter(_INDEX_CACHE))]
+        _INDEX_CACHE[key] = cached
+    order, breaks, trie = cached
+    return [commands[idx] for idx in order], breaks, trie
+
+
 class CommandPalette(ModalScreen):
     """Command palette modal screen."""
 
@@ -303,10 +435,26 @@ class CommandPalette(ModalScreen):
 
     selected_index: reactive[int] = reactive(0)
 
+    # Max number of matches shown for a search (an empty query lists everything)
+    MAX_RESULTS = 10
+    # Max number of queries whose results are remembered (oldest evicted first)
+    FILTER_CACHE_SIZE = 128
+
     def __init__(self, commands: List[Command] = None):
         super().__init__()
-        self.commands = commands or DEFAULT_COMMANDS
+        self.commands, self._category_breaks, self._prefix_trie = _index_commands(
+            commands or DEFAULT_COMMANDS
+        )
         self.filtered_commands = self.commands.copy()
+        # Debounced search: only the latest query typed within the window renders
+        self._filter_timer = None
+        self._pending_query = ""
+        # Lowercased query -> matching command indices, in LRU order
+        self._filter_cache: Dict[str, List[int]] = {}
+        # Last query that needed a full scan, and its matches. A query that
+        # extends it can only match a subset, so the next scan narrows these.
+        self._last_query = ""
+        self._last_matches: List[int] = []
 
     def compose(self) -> ComposeResult:
         with Container(id="palette-container"):
@@ -330,10 +478,21 @@ class CommandPalette(ModalScreen):
 
     def on_input_changed(self, event: Input.Changed) -> None:
         if event.input.id == "search-input":
-            self.update_results(event.value)
+            self._pending_query = event.value
+            if self._filter_timer is not None:
+                self._filter_timer.stop()
+            self._filter_timer = self.set_timer(0.04, self._apply_pending_query)
+
+    def _apply_pending_query(self) -> None:
+        self._filter_timer = None
+        self.update_results(self._pending_query)
 
     def on_input_submitted(self, event: Input.Submitted) -> None:
         if event.input.id == "search-input":
+            # Don't execute against results from a superseded query
+            if self._filter_timer is not None:
+                self._filter_timer.stop()
+                self._apply_pending_query()
             self.execute_selected_command()
 
     def action_cursor_down(self) -> None:
@@ -348,25 +507,61 @@ class CommandPalette(ModalScreen):
         self.selected_index = (self.selected_index - 1) % len(self.filtered_commands)
         self.highlight_selected()
 
+    def filter_commands(self, query: str) -> None:
+        """Set ``filtered_commands`` to the commands matching ``query``."""
+        key = query.lower()
+        cache = self._filter_cache
+        indices = cache.pop(key, None)
+        if indices is None:
+            indices = self._match_indices(key)
+            if len(cache) >= self.FILTER_CACHE_SIZE:
+                del cache[next(iter(cache))]
+        # (Re)insert so the dict's order tracks recency
+        cache[key] = indices
+        self.filtered_commands = [self.commands[idx] for idx in indices]
+
+    def _match_indices(self, query: str) -> List[int]:
+        if not query:
+            return list(range(len(self.commands)))
+        # Word-prefix hits come straight from the trie; only fall back to
+        # the substring/fuzzy scan when there are none
+        commands = self.commands
+        hits = _prefix_lookup(self._prefix_trie, query)
+        if hits:
+            scored = [(commands[idx].score(query) or 0, idx) for idx in hits]
+        else:
+            candidates = range(len(commands))
+            if self._last_query and query.startswith(self._last_query):
+                candidates = self._last_matches
+            scored = []
+            for idx in candidates:
+                score = commands[idx].score(query)
+                if score is not None:
+                    scored.append((score, idx))
+            self._last_query = query
+            self._last_matches = [idx for _, idx in scored]
+        # Best first, keeping only the top MAX_RESULTS; ties keep declaration order
+        top = heapq.nlargest(self.MAX_RESULTS, scored, key=lambda item: item[0])
+        return [idx for _, idx in top]
+
     def update_results(self, query: str) -> None:
+        self.filter_commands(query)
+        breaks = None
         if query:
-            self.filtered_commands = [cmd for cmd in self.commands if cmd.matches(query)]
+            # Keep the ranking: categories appear in order of their best match
+            rank: Dict[str, int] = {}
+            for cmd in self.filtered_commands:
+                rank.setdefault(cmd.category, len(rank))
+            self.filtered_commands.sort(key=lambda c: rank[c.category])
         else:
-            self.filtered_commands = self.commands.copy()
-
-        self.filtered_commands.sort(key=lambda c: c.category)
+            # self.commands is already grouped, with cached header positions
+            breaks = self._category_breaks
 
         command_list = self.query_one("#command-list", CommandList)
-        command_list.clear()
+        command_list.show(self.filtered_commands, breaks)
 
         if self.filtered_commands:
             self.query_one("#no-results").add_class("hidden")
-            current_category = None
-            for cmd in self.filtered_commands:
-                if cmd.category != current_category:
-                    command_list.add_category(cmd.category)
-                    current_category = cmd.category
-                command_list.add_command(cmd)
         else:
             self.query_one("#no-results").remove_class("hidden")
 
@@ -384,24 +579,49 @@ class CommandPalette(ModalScreen):
 
 
 class CommandList(VerticalScroll):
-    """Scrollable list of commands."""
+    """Scrollable list of commands.
+
+    Rows are pooled: ``show`` rewrites existing rows in place, mounts more
+    only when the list grows past the pool, and hides the surplus.
+    """
 
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
+        self._rows: List[CommandItem] = []
         self.command_items: List[CommandItem] = []
 
-    def clear(self) -> None:
-        self.remove_children()
-        self.command_items = []
+    def show(self, commands: List[Command], breaks: Optional[Set[int]] = None) -> None:
+        """Display ``commands`` (grouped by category) using the row pool.
+
+        ``breaks`` are the indices where a category header goes; they are
+        computed from ``commands`` when not given.
+        """
+        if breaks is None:
+            breaks = _category_breaks(commands)
+        entries = []
+        for idx, cmd in enumerate(commands):
+            if idx in breaks:
+                entries.append(cmd.category)
+            entries.append(cmd)
+
+        if len(entries) > len(self._rows):
+            extra = [CommandItem() for _ in range(len(entries) - len(self._rows))]
+            self._rows.extend(extra)
+            self.mount_all(extra)
 
-    def add_category(self, category: str) -> None:
-        header = Static(f"─── {category} ───", classes="command-category")
-        self.mount(header)
+        self.command_items = []
+        for row, entry in zip(self._rows, entries):
+            if isinstance(entry, Command):
+                row.show_command(entry)
+                self.command_items.append(row)
+            else:
+                row.show_category(entry)
+            row.display = True
+        for row in self._rows[len(entries):]:
+            row.display = False
 
-    def add_command(self, command: Command) -> None:
-        item = CommandItem(command)
-        self.mount(item)
-        self.command_items.append(item)
+    def clear(self) -> None:
+        self.show([])
 
     def highlight(self, index: int) -> None:
         for idx, item in enumerate(self.command_items):
@@ -411,33 +631,23 @@ class CommandList(VerticalScroll):
                 item.remove_class("selected")
 
 
-class CommandItem(Container):
-    """Individual command item."""
+class CommandItem(Static):
+    """A pooled row showing either a command or a category header."""
 
-    def __init__(self, command: Command):
+    def __init__(self):
         super().__init__(classes="command-item")
-        self.command = command
-
-    def compose(self) -> ComposeResult:
-        yield CommandItemContent(self.command)
-
-
-class CommandItemContent(Static):
-    """Content of a command item."""
-
-    def __init__(self, command: Command):
-        super().__init__()
-        self.command = command
-
-    def on_mount(self) -> None:
-        text = Text()
-        text.append(self.command.name, style="bold white")
-        if self.command.shortcut:
-            text.append("  ", style="")
-            text.append(f"({self.command.shortcut})", style="dim cyan")
-        text.append("\n", style="")
-        text.append(self.command.description, style="dim white")
-        self.update(text)
+        self.command: Optional[Command] = None
+
+    def show_command(self, command: Command) -> None:
+        self.set_classes("command-item")
+        if command is not self.command:
+            self.command = command
+            self.update(command._row_text)
+
+    def show_category(self, category: str) -> None:
+        self.command = None
+        self.set_classes("command-category")
+        self.update(f"─── {category} ───")
 
 
 __all__ = [
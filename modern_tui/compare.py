@@ -3,15 +3,88 @@ from textual.widgets import Button, Label, Markdown
 
 import difflib
 
+try:
+    from cdifflib import CSequenceMatcher as SequenceMatcher
+except Exception:
+    SequenceMatcher = difflib.SequenceMatcher
+
+# Responses longer than this (in lines) are diffed with _unified_diff_fast
+LARGE_DIFF_LINES = 500
+
+
+def _format_range(start: int, stop: int) -> str:
+    """Unified-diff hunk range, as in difflib.unified_diff."""
+    length = stop - start
+    if length == 1:
+        return f"{start + 1}"
+    if not length:
+        start -= 1
+    return f"{start + 1},{length}"
+
+
+def _unified_diff_fast(ta, tb, a: str, b: str, n: int = 3):
+    """Same output as difflib.unified_diff(..., lineterm=''), but matched with
+    cdifflib's C SequenceMatcher when it is installed."""
+    started = False
+    for group in SequenceMatcher(None, ta, tb, autojunk=True).get_grouped_opcodes(n):
+        if not started:
+            started = True
+            yield f"--- {a}"
+            yield f"+++ {b}"
+        first, last = group[0], group[-1]
+        yield f"@@ -{_format_range(first[1], last[2])} +{_format_range(first[3], last[4])} @@"
+        for tag, i1, i2, j1, j2 in group:
+            if tag == 'equal':
+                for line in ta[i1:i2]:
+                    yield ' ' + line
+                continue
+            if tag in ('replace', 'delete'):
+                for line in ta[i1:i2]:
+                    yield '-' + line
+            if tag in ('replace', 'insert'):
+                for line in tb[j1:j2]:
+                    yield '+' + line
+
+
+def _diff_markdown(ai, turn_id: str, a: str, b: str) -> Markdown:
+    """Build the Markdown diff of two models' responses for a turn."""
+    ta = get_response_text(ai, turn_id, a).splitlines()
+    tb = get_response_text(ai, turn_id, b).splitlines()
+    if max(len(ta), len(tb)) > LARGE_DIFF_LINES:
+        diff = list(_unified_diff_fast(ta, tb, a, b))
+    else:
+        diff = list(difflib.unified_diff(ta, tb, fromfile=a, tofile=b, lineterm=''))
+    text = '```\n' + '\n'.join(diff) + '\n```'
+    return Markdown(f"**Diff {a} vs {b}**\n\n{text}")
+
+
+def _response_index(ai, conv) -> dict:
+    """Map (turn_id, model) -> assistant message for ``conv``, cached on ``ai``.
+
+    The index holds the message dicts themselves, so in-place content updates
+    are seen; it is rebuilt when the conversation or its length changes.
+    """
+    messages = conv.get('messages', [])
+    key = (conv['id'], len(messages))
+    cached = getattr(ai, '_response_index', None)
+    if cached is not None and cached[0] == key:
+        return cached[1]
+    index = {}
+    for m in messages:
+        if m.get('role') == 'assistant':
+            index.setdefault((m.get('turn_id'), m.get('model')), m)
+    ai._response_index = (key, index)
+    return index
+
 
 def get_response_text(ai, turn_id: str, model_name: str) -> str:
     """Retrieve response text for a model in a turn from conversation storage or UI."""
     try:
         conv = next((c for c in ai._conversations if c['id'] == ai._current_conv_id), None)
         if conv:
-            for m in conv.get('messages', []):
-                if m.get('role') == 'assistant' and m.get('model') == model_name and m.get('turn_id') == turn_id:
-                    return m.get('content', '')
+            m = _response_index(ai, conv).get((turn_id, model_name))
+            if m is not None:
+                return m.get('content', '')
     except Exception:
         pass
     try:
@@ -23,70 +96,52 @@ def get_response_text(ai, turn_id: str, model_name: str) -> str:
 
 
 def handle_compare(ai, turn_id: str, m1: str = None, m2: str = None):
-    """Handle compare action: if two models specified, show diff; otherwise show metrics and pair buttons."""
-    try:
-        group = ai._groups.get(turn_id, {})
-        models = group.get('models', [])
-        if not models:
-            try:
-                ai.query_one('#chat-history').mount(Label('No models found for this turn.', classes='error-msg'))
-            except Exception:
-                pass
-            return
+    """Handle compare action: if two models specified, show diff; otherwise show metrics and pair buttons.
 
-        if m1 and m2:
-            a = next((x for x in models if ai._sanitize_id(x) == m1), None)
-            b = next((x for x in models if ai._sanitize_id(x) == m2), None)
-            if not a or not b:
-                try:
-                    ai.query_one('#chat-history').mount(Label('Error: models not found for comparison.', classes='error-msg'))
-                except Exception:
-                    pass
-                return
-            ta = get_response_text(ai, turn_id, a).splitlines()
-            tb = get_response_text(ai, turn_id, b).splitlines()
-            diff = list(difflib.unified_diff(ta, tb, fromfile=a, tofile=b, lineterm=''))
-            text = '```\n' + '\n'.join(diff) + '\n```'
-            try:
-                ai.query_one('#chat-history').mount(Markdown(f"**Diff {a} vs {b}**\n\n{text}"))
-            except Exception:
-                pass
-            return
+    Errors propagate to the caller (``AIClient.handle_compare`` reports them).
+    """
+    chat_history = ai.query('#chat-history')
+    if not chat_history:
+        return
+    chat_history = chat_history.first()
+
+    group = getattr(ai, '_groups', {}).get(turn_id, {})
+    models = group.get('models', [])
+    if not models:
+        chat_history.mount(Label('No models found for this turn.', classes='error-msg'))
+        return
+    sanitized = [ai._sanitize_id(m) for m in models]
 
-        if len(models) == 2:
-            a, b = models[0], models[1]
-            ta = get_response_text(ai, turn_id, a).splitlines()
-            tb = get_response_text(ai, turn_id, b).splitlines()
-            diff = list(difflib.unified_diff(ta, tb, fromfile=a, tofile=b, lineterm=''))
-            text = '```\n' + '\n'.join(diff) + '\n```'
-            try:
-                ai.query_one('#chat-history').mount(Markdown(f"**Diff {a} vs {b}**\n\n{text}"))
-            except Exception:
-                pass
+    if m1 and m2:
+        a = models[sanitized.index(m1)] if m1 in sanitized else None
+        b = models[sanitized.index(m2)] if m2 in sanitized else None
+        if not a or not b:
+            chat_history.mount(Label('Error: models not found for comparison.', classes='error-msg'))
             return
+        chat_history.mount(_diff_markdown(ai, turn_id, a, b))
+        return
 
-        rows = []
-        for i in range(len(models)):
-            for j in range(i+1, len(models)):
-                x = models[i]
-                y = models[j]
-                tx = set(get_response_text(ai, turn_id, x).split())
-                ty = set(get_response_text(ai, turn_id, y).split())
-                overlap = len(tx & ty)
-                total = max(1, len(tx | ty))
-                pct = int(100.0 * overlap / total)
-                rows.append((x, y, overlap, total, pct))
-        try:
-            box = Vertical()
-            box.mount(Label('Comparison pairs:'))
-            for r in rows:
-                a, b, overlap, total, pct = r
-                h = Horizontal()
-                h.mount(Label(f"{a} vs {b} — overlap {overlap}/{total} ({pct}%)"))
-                h.mount(Button('Compare', id=f'comparepair-{turn_id}-{ai._sanitize_id(a)}-{ai._sanitize_id(b)}'))
-                box.mount(h)
-            ai.query_one('#chat-history').mount(box)
-        except Exception:
-            pass
-    except Exception:
-        pass
\ No newline at end of file
+    if len(models) == 2:
+        a, b = models[0], models[1]
+        chat_history.mount(_diff_markdown(ai, turn_id, a, b))
+        return
+
+    rows = []
+    # Tokenize each response once; every pair reuses the same sets
+    word_sets = [set(get_response_text(ai, turn_id, m).split()) for m in models]
+    for i in range(len(models)):
+        for j in range(i+1, len(models)):
+            tx, ty = word_sets[i], word_sets[j]
+            overlap = len(tx & ty)
+            total = max(1, len(tx | ty))
+            pct = int(100.0 * overlap / total)
+            rows.append((i, j, overlap, total, pct))
+    # Build the whole tree up front so it is mounted (and laid out) once
+    pair_rows = [
+        Horizontal(
+            Label(f"{models[i]} vs {models[j]} — overlap {overlap}/{total} ({pct}%)"),
+            Button('Compare', id=f'comparepair-{turn_id}-{sanitized[i]}-{sanitized[j]}'),
+        )
+        for i, j, overlap, total, pct in rows
+    ]
+    chat_history.mount(Vertical(Label('Comparison pairs:'), *pair_rows))
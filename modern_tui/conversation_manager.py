@@ -3,17 +3,53 @@ ConversationManager for centralized conversation state management.
 Inspired by OpenCode's context-based state pattern (useSync, useSDK, etc.).
 """
 
+import asyncio
+import atexit
 import json
+import threading
 import uuid
 import time
+import weakref
 from pathlib import Path
-from typing import Optional, List, Dict, Any
-from dataclasses import dataclass, asdict
+from typing import Optional, List, Dict, Any, Iterator, Set
+from dataclasses import dataclass, asdict, field
 import os
 from datetime import datetime
+from operator import attrgetter
 
+try:
+    import orjson
+except Exception:
+    orjson = None
 
-@dataclass
+
+def _dumps(obj: Any) -> bytes:
+    """Serialize to compact JSON bytes (orjson when installed)."""
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj, ensure_ascii=False).encode("utf-8")
+
+
+def _loads(data: bytes) -> Any:
+    """Parse JSON bytes (orjson when installed)."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+# Managers with a pending debounced save. Weak, so a manager that is
+# dropped doesn't live on just to be flushed at exit.
+_unsaved_managers: "weakref.WeakSet[ConversationManager]" = weakref.WeakSet()
+
+
+@atexit.register
+def _flush_unsaved_managers():
+    """Don't lose pending debounced saves when the process exits."""
+    for manager in list(_unsaved_managers):
+        manager.flush()
+
+
+@dataclass(slots=True)
 class Message:
     """Represents a single message in a conversation."""
 
@@ -23,6 +59,9 @@ class Message:
     model: Optional[str] = None
     timestamp: Optional[datetime] = None
     turn_id: Optional[str] = None
+    # Render caches filled in by ChatArea (not persisted)
+    _is_plain: Optional[bool] = field(default=None, init=False, repr=False, compare=False)
+    _ts_hm: Optional[str] = field(default=None, init=False, repr=False, compare=False)
 
     def to_dict(self) -> Dict[str, Any]:
         """Convert to serializable dict."""
@@ -51,47 +90,64 @@ class Message:
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class Conversation:
-    """Represents a full conversation."""
+    """Represents a full conversation.
+
+    ``messages`` may hold raw dicts straight from storage; ``get_messages()``
+    converts them to ``Message`` objects on first access.
+    """
 
     id: str
     title: str
-    messages: List[Message]
+    messages: List[Any]
     model: Optional[str] = None
     created_at: Optional[datetime] = None
     last_updated: Optional[datetime] = None
+    # last_updated as a POSIX timestamp, kept in step by __post_init__/touch()
+    _last_updated_ts: float = field(default=0.0, init=False, repr=False, compare=False)
 
     def __post_init__(self):
         if self.created_at is None:
             self.created_at = datetime.now()
         if self.last_updated is None:
             self.last_updated = datetime.now()
+        self._last_updated_ts = self.last_updated.timestamp()
         # Ensure a sensible default model (can be overridden via env var)
         if not self.model:
             self.model = os.environ.get("MODERN_TUI_DEFAULT_MODEL", "llama3")
 
-    def to_dict(self) -> Dict[str, Any]:
+    def to_dict(self, include_messages: bool = True) -> Dict[str, Any]:
         """Convert to serializable dict."""
-        return {
+        d = {
             "id": self.id,
             "title": self.title,
-            "messages": [m.to_dict() for m in self.messages],
             "model": self.model,
             "created_at": self.created_at.isoformat() if self.created_at else None,
             "last_updated": self.last_updated.isoformat() if self.last_updated else None,
         }
+        if include_messages:
+            d["messages"] = [m.to_dict() if isinstance(m, Message) else m for m in self.messages]
+        return d
+
+    def touch(self):
+        """Mark the conversation as updated now."""
+        self.last_updated = datetime.now()
+        self._last_updated_ts = self.last_updated.timestamp()
+
+    def get_messages(self) -> List[Message]:
+        """Return the messages, parsing any still-raw dicts in place."""
+        messages = self.messages
+        for i, m in enumerate(messages):
+            if isinstance(m, dict):
+                messages[i] = Message.from_dict(m)
+        return messages
 
     @staticmethod
     def from_dict(d: Dict[str, Any]) -> "Conversation":
         """Create Conversation from dict (handles legacy format)."""
-        # Handle legacy format where messages are plain dicts
-        messages = []
-        for msg_data in d.get("messages", []):
-            if isinstance(msg_data, dict):
-                messages.append(Message.from_dict(msg_data))
-            else:
-                messages.append(msg_data)
+        # Messages stay raw dicts until get_messages() is called
+        messages = list(d.get("messages", []))
 
         created_at = d.get("created_at")
         if created_at and isinstance(created_at, str):
@@ -112,18 +168,84 @@ class Conversation:
 
 
 
+class _TitleIndex:
+    """Suffix trie over lowercased title words, mapping to conversation ids.
+
+    Every suffix of every word is indexed, so looking up a query without
+    whitespace finds exactly the titles containing it as a substring.
+    """
+
+    def __init__(self):
+        # char -> child node; the None key holds the ids under that node
+        self._root: Dict[Any, Any] = {}
+
+    def _paths(self, title: str) -> Iterator[str]:
+        for word in set(title.lower().split()):
+            for start in range(len(word)):
+                yield word[start:]
+
+    def add(self, conv_id: str, title: str):
+        for suffix in self._paths(title):
+            node = self._root
+            for char in suffix:
+                node = node.setdefault(char, {})
+                node.setdefault(None, set()).add(conv_id)
+
+    def discard(self, conv_id: str, title: str):
+        for suffix in self._paths(title):
+            node = self._root
+            for char in suffix:
+                node = node.get(char)
+                if node is None:
+                    break
+                node.get(None, set()).discard(conv_id)
+
+    def lookup(self, query: str) -> Set[str]:
+        node = self._root
+        for char in query:
+            node = node.get(char)
+            if node is None:
+                return set()
+        return set(node.get(None, ()))
+
+
 class ConversationManager:
     """
     Central state manager for conversations.
     Provides persistent storage and in-memory access patterns.
+
+    Conversation metadata lives in ``storage_path``; each conversation's
+    messages are an append-only JSONL file in ``messages_dir``, read the
+    first time the conversation is fetched with ``get()``.
+
+    Mutations mark the store dirty and schedule a debounced save; call
+    ``flush()`` to write pending changes immediately.
     """
 
+    # Seconds to wait after the last mutation before writing to disk
+    SAVE_DELAY = 1.0
+
     def __init__(self, storage_path: Optional[Path] = None):
         self.storage_path = (
             storage_path or Path(__file__).resolve().parent / "conversations.json"
         )
+        self.messages_dir = self.storage_path.parent / f"{self.storage_path.stem}_messages"
         self._conversations: Dict[str, Conversation] = {}
         self._current_id: Optional[str] = None
+        # Conversations whose JSONL hasn't been read yet
+        self._unloaded: Set[str] = set()
+        # Conversations loaded from the legacy all-in-one format, whose
+        # messages still need writing out to JSONL
+        self._legacy: Set[str] = set()
+        # Conversations whose messages are still raw dicts (legacy format)
+        self._unparsed: Set[str] = set()
+        self._title_index = _TitleIndex()
+        self._dirty = False
+        self._save_handle: Optional[asyncio.TimerHandle] = None
+        # Loop that owns _save_handle; off-loop callers hand saves back to it
+        self._save_loop: Optional[asyncio.AbstractEventLoop] = None
+        # Serializes writers (loop, worker threads, atexit) on the .tmp file
+        self._save_lock = threading.RLock()
         self._load()
 
     def _load(self):
@@ -132,45 +254,143 @@ class ConversationManager:
             return
 
         try:
-            with open(self.storage_path, "r", encoding="utf-8") as f:
-                data = json.load(f)
+            with open(self.storage_path, "rb") as f:
+                data = _loads(f.read())
+            conversations = data.get("conversations", {})
             self._conversations = {
-                cid: Conversation.from_dict(cdata)
-                for cid, cdata in data.get("conversations", {}).items()
+                cid: Conversation.from_dict(cdata) for cid, cdata in conversations.items()
             }
+            for cid, cdata in conversations.items():
+                if cdata.get("messages"):
+                    self._legacy.add(cid)
+                    self._unparsed.add(cid)
+                else:
+                    self._unloaded.add(cid)
             self._current_id = data.get("current")
+            for cid, conv in self._conversations.items():
+                self._title_index.add(cid, conv.title)
         except Exception as e:
             print(f"Error loading conversations: {e}")
 
     def save(self):
         """Save all conversations to disk."""
+        with self._save_lock:
+            try:
+                # Migrate legacy conversations' messages to JSONL first
+                for cid in list(self._legacy):
+                    conv = self._conversations.get(cid)
+                    if conv is not None:
+                        self._write_messages(conv)
+                    self._legacy.discard(cid)
+                data = {
+                    "conversations": {
+                        cid: conv.to_dict(include_messages=False)
+                        for cid, conv in self._conversations.items()
+                    },
+                    "current": self._current_id,
+                }
+                # Compact output; write to a temp file so a crash can't truncate the store
+                tmp_path = self.storage_path.with_name(self.storage_path.name + ".tmp")
+                with open(tmp_path, "wb") as f:
+                    f.write(_dumps(data))
+                os.replace(tmp_path, self.storage_path)
+                self._dirty = False
+                _unsaved_managers.discard(self)
+            except Exception as e:
+                print(f"Error saving conversations: {e}")
+
+    def flush(self):
+        """Write pending changes now, cancelling any scheduled save."""
+        with self._save_lock:
+            if self._save_handle is not None:
+                self._save_handle.cancel()
+                self._save_handle = None
+            if self._dirty:
+                self.save()
+
+    def _mark_dirty(self):
+        """Record a mutation and (re)schedule a debounced save.
+
+        Without a running event loop (e.g. scripts, worker threads) the
+        store is saved immediately, unless a save is already scheduled on
+        another thread's loop, in which case that loop reschedules it.
+        """
+        self._dirty = True
+        _unsaved_managers.add(self)
         try:
-            data = {
-                "conversations": {
-                    cid: conv.to_dict() for cid, conv in self._conversations.items()
-                },
-                "current": self._current_id,
-            }
-            with open(self.storage_path, "w", encoding="utf-8") as f:
-                json.dump(data, f, indent=2)
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            owner = self._save_loop
+            if self._save_handle is not None and owner is not None and not owner.is_closed():
+                # A save is already scheduled on another thread's loop; let
+                # that loop reschedule it rather than writing concurrently
+                owner.call_soon_threadsafe(self._schedule_save, owner)
+            else:
+                self.flush()
+            return
+        self._schedule_save(loop)
+
+    def _schedule_save(self, loop: asyncio.AbstractEventLoop):
+        """(Re)arm the debounced save on ``loop``; call from that loop's thread."""
+        if self._save_handle is not None:
+            self._save_handle.cancel()
+        self._save_loop = loop
+        self._save_handle = loop.call_later(self.SAVE_DELAY, self.flush)
+
+    # Per-conversation message logs
+    def _messages_path(self, conv_id: str) -> Path:
+        return self.messages_dir / f"{conv_id}.jsonl"
+
+    def _read_messages(self, conv_id: str) -> Iterator[Message]:
+        """Yield a conversation's messages from its JSONL log."""
+        path = self._messages_path(conv_id)
+        if not path.exists():
+            return
+        with open(path, "rb") as f:
+            for line in f:
+                if line.strip():
+                    yield Message.from_dict(_loads(line))
+
+    def _append_message(self, conv_id: str, msg_dict: Dict[str, Any]):
+        """Append one message to a conversation's JSONL log."""
+        try:
+            self.messages_dir.mkdir(parents=True, exist_ok=True)
+            with open(self._messages_path(conv_id), "ab") as f:
+                f.write(_dumps(msg_dict) + b"\n")
         except Exception as e:
-            print(f"Error saving conversations: {e}")
+            print(f"Error saving message: {e}")
+
+    def _write_messages(self, conv: Conversation):
+        """Rewrite a conversation's whole JSONL log."""
+        self.messages_dir.mkdir(parents=True, exist_ok=True)
+        with open(self._messages_path(conv.id), "wb") as f:
+            f.write(b"".join(_dumps(m.to_dict()) + b"\n" for m in conv.get_messages()))
 
     # Query methods (read-only)
     def get_all(self) -> List[Conversation]:
         """Get all conversations, sorted by last_updated descending."""
-        def sort_key(c: Conversation) -> float:
-            return c.last_updated.timestamp() if c.last_updated else 0
-        
         return sorted(
             self._conversations.values(),
-            key=sort_key,
+            key=attrgetter("_last_updated_ts"),
             reverse=True,
         )
 
     def get(self, conv_id: str) -> Optional[Conversation]:
-        """Get a conversation by ID."""
-        return self._conversations.get(conv_id)
+        """Get a conversation by ID (loading its messages on first access)."""
+        conv = self._conversations.get(conv_id)
+        if conv is None:
+            return None
+        if conv_id in self._unloaded:
+            self._unloaded.discard(conv_id)
+            try:
+                conv.messages = list(self._read_messages(conv_id))
+            except Exception as e:
+                print(f"Error loading messages: {e}")
+        if conv_id in self._unparsed:
+            # Parse once; later lookups return conv without rescanning
+            self._unparsed.discard(conv_id)
+            conv.get_messages()
+        return conv
 
     def get_current(self) -> Optional[Conversation]:
         """Get currently selected conversation."""
@@ -192,33 +412,43 @@ class ConversationManager:
             messages=[],
         )
         self._conversations[conv_id] = conv
+        self._title_index.add(conv_id, conv.title)
         self._current_id = conv_id
-        self.save()
+        self._mark_dirty()
         return conv
 
     def delete(self, conv_id: str):
         """Delete a conversation."""
         if conv_id in self._conversations:
-            del self._conversations[conv_id]
+            self._title_index.discard(conv_id, self._conversations.pop(conv_id).title)
+            self._unloaded.discard(conv_id)
+            self._legacy.discard(conv_id)
+            self._unparsed.discard(conv_id)
+            try:
+                self._messages_path(conv_id).unlink()
+            except FileNotFoundError:
+                pass
             if self._current_id == conv_id:
                 # Select first remaining conversation
                 remaining = list(self._conversations.keys())
                 self._current_id = remaining[0] if remaining else None
-            self.save()
+            self._mark_dirty()
 
     def select(self, conv_id: str):
         """Select a conversation as current."""
         if conv_id in self._conversations:
             self._current_id = conv_id
-            self.save()
+            self._mark_dirty()
 
     def rename(self, conv_id: str, new_title: str):
         """Rename a conversation."""
         conv = self.get(conv_id)
         if conv:
+            self._title_index.discard(conv_id, conv.title)
+            self._title_index.add(conv_id, new_title)
             conv.title = new_title
-            conv.last_updated = datetime.now()
-            self.save()
+            conv.touch()
+            self._mark_dirty()
 
     def add_message(
         self,
@@ -240,8 +470,11 @@ class ConversationManager:
             timestamp=datetime.now(),
         )
         conv.messages.append(msg)
-        conv.last_updated = datetime.now()
-        self.save()
+        conv.touch()
+        if conv_id not in self._legacy:
+            # Legacy conversations get their full log written on the next save
+            self._append_message(conv_id, msg.to_dict())
+        self._mark_dirty()
         return msg
 
     def get_messages(self, conv_id: str) -> List[Message]:
@@ -253,8 +486,12 @@ class ConversationManager:
     def search(self, query: str) -> List[Conversation]:
         """Search conversations by title."""
         q_lower = query.lower()
-        return [
-            c
-            for c in self.get_all()
-            if q_lower in c.title.lower()
-        ]
+        if not q_lower or any(char.isspace() for char in q_lower):
+            # Empty or multi-word queries can't use the word index
+            return [c for c in self.get_all() if q_lower in c.title.lower()]
+        ids = self._title_index.lookup(q_lower)
+        return sorted(
+            (self._conversations[cid] for cid in ids if cid in self._conversations),
+            key=attrgetter("_last_updated_ts"),
+            reverse=True,
+        )
@@ -1,36 +1,92 @@
+import atexit
+import os
+import secrets
 import time
 import json
+from contextlib import contextmanager
 from pathlib import Path
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+# Resolved once; __file__ doesn't move at runtime
+_CONV_PATH = Path(__file__).resolve().parent / 'conversations.json'
+
+# Unsaved changes made by create_conversation, written by flush_conversations
+_dirty = False
+_pending = None
+
 
 def conversations_file_path():
-    return Path(__file__).resolve().parent / 'conversations.json'
+    return _CONV_PATH
 
 
 def load_conversations():
-    p = conversations_file_path()
+    # No exists() check: a missing file is just FileNotFoundError (an OSError)
     try:
-        if p.exists():
-            with open(p, 'r', encoding='utf-8') as f:
-                data = json.load(f)
-                return data.get('conversations', [])
-    except Exception:
-        pass
-    return []
+        with open(_CONV_PATH, 'rb') as f:
+            raw = f.read()
+        data = orjson.loads(raw) if orjson is not None else json.loads(raw)
+        return data.get('conversations', [])
+    except (OSError, ValueError):
+        return []
 
 
 def save_conversations(conv_list):
-    p = conversations_file_path()
+    global _dirty, _pending
+    p = _CONV_PATH
     try:
-        with open(p, 'w', encoding='utf-8') as f:
-            json.dump({'conversations': conv_list}, f, indent=2, ensure_ascii=False)
+        data = {'conversations': conv_list}
+        # Encode in one go and write once, rather than json.dump's per-chunk writes
+        if orjson is not None:
+            payload = orjson.dumps(data, option=orjson.OPT_INDENT_2)
+        else:
+            payload = json.dumps(data, indent=2, ensure_ascii=False).encode('utf-8')
+        # Write a temp file and rename it over the store, so a crash
+        # mid-write can't leave truncated JSON behind
+        tmp = p.with_suffix('.json.tmp')
+        with open(tmp, 'wb') as f:
+            f.write(payload)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp, p)
+        # This save supersedes any deferred one; don't let a later flush
+        # write the older pending list back over it
+        _dirty = False
+        _pending = None
     except Exception:
         pass
 
 
 def create_conversation(conv_list, title: str = 'New Conversation'):
-    import uuid
-    new = {'id': str(uuid.uuid4())[:8], 'title': title, 'messages': [], 'last_updated': time.time()}
+    new = {'id': secrets.token_hex(4), 'title': title, 'messages': [], 'last_updated': time.time()}
     conv_list.insert(0, new)
-    save_conversations(conv_list)
-    return new
\ No newline at end of file
+    _mark_dirty(conv_list)
+    return new
+
+
+def _mark_dirty(conv_list):
+    global _dirty, _pending
+    _dirty = True
+    _pending = conv_list
+
+
+def flush_conversations():
+    """Save pending changes, if any."""
+    if _dirty:
+        save_conversations(_pending)
+
+
+@contextmanager
+def batch():
+    """Group several mutations into a single save on exit."""
+    try:
+        yield
+    finally:
+        flush_conversations()
+
+
+atexit.register(flush_conversations)
\ No newline at end of file
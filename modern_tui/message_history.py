@@ -43,11 +43,7 @@ class MessageHistory(ScrollableContainer):
 
     def _clear(self):
         """Clear all message widgets."""
-        for child in list(self.children):
-            try:
-                child.remove()
-            except Exception:
-                pass
+        self.remove_children()
 
     def _render_all_messages(self):
         """Render all messages from current conversation."""
@@ -18,24 +18,62 @@ from __future__ import annotations
 
 import json
 import shutil
+import struct
 import threading
 import time
-from dataclasses import dataclass, field, asdict
+from dataclasses import dataclass, field, fields, replace
 from enum import Enum
+from functools import lru_cache, partial
 from itertools import count
-from typing import Callable, Optional, Tuple, Dict, Any
-
-from rich.text import Text
+from types import MappingProxyType
+from typing import Callable, Optional, Tuple, Dict, Any, List, NamedTuple
+
+from rich.text import Span, Text
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    from numba import njit
+except ImportError:
+    def njit(*args, **kwargs):
+        """No-op stand-in for numba.njit, usable bare or with options."""
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+        return lambda func: func
 
 # Type aliases
 RGB = Tuple[int, int, int]
 ColorFormatter = Callable[[float], str]
 
+_RGB_STRUCT = struct.Struct("BBB")
+
 # Thread-safe ID generation
 _id_generator = count(1)
 _id_lock = threading.Lock()
 
 
+def _dumps(obj: Any) -> bytes:
+    """Serialize to indented JSON bytes (orjson when installed)."""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+    return json.dumps(obj, indent=2).encode("utf-8")
+
+
+def _loads(data: bytes) -> Any:
+    """Parse JSON bytes (orjson when installed)."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
 def next_id() -> int:
     """Thread-safe unique ID generation for progress bar instances."""
     with _id_lock:
@@ -44,7 +82,14 @@ def next_id() -> int:
 
 def clamp01(value: float) -> float:
     """Clamp a float into [0.0, 1.0]."""
-    return max(0.0, min(1.0, float(value)))
+    # Plain comparisons beat max()/min() calls by ~3x on this hot path.
+    # NaN fails both tests and clamps to 1.0, as max(0.0, min(1.0, nan)) did.
+    value = float(value)
+    if value <= 0.0:
+        return 0.0
+    if value <= 1.0:
+        return value
+    return 1.0
 
 
 def rgb_to_hex(rgb: RGB) -> str:
@@ -53,6 +98,8 @@ def rgb_to_hex(rgb: RGB) -> str:
     return f"#{int(r):02x}{int(g):02x}{int(b):02x}"
 
 
+# Gradient bars parse the same handful of colors every frame
+@lru_cache(maxsize=256)
 def hex_to_rgb(color: str) -> RGB:
     """Parse '#RGB' or '#RRGGBB' into an (r, g, b) tuple."""
     c = color.strip().lstrip("#")
@@ -60,7 +107,7 @@ def hex_to_rgb(color: str) -> RGB:
         c = "".join(ch * 2 for ch in c)
     if len(c) != 6:
         raise ValueError(f"Invalid hex color: {color!r}")
-    return int(c[0:2], 16), int(c[2:4], 16), int(c[4:6], 16)
+    return _RGB_STRUCT.unpack(bytes.fromhex(c))
 
 
 def interpolate_rgb(start: RGB, end: RGB, t: float) -> RGB:
@@ -73,6 +120,21 @@ def interpolate_rgb(start: RGB, end: RGB, t: float) -> RGB:
     )
 
 
+def _gamma_expand(c: float) -> float:
+    """sRGB channel (0-255) -> linear light (0.0-1.0)."""
+    c_norm = c / 255.0
+    if c_norm <= 0.04045:
+        return c_norm / 12.92
+    return ((c_norm + 0.055) / 1.055) ** 2.4
+
+
+def _gamma_compress(linear: float) -> int:
+    """Linear light (0.0-1.0) -> sRGB channel (0-255)."""
+    if linear <= 0.0031308:
+        return int(linear * 12.92 * 255)
+    return int(((1.055 * (linear ** (1 / 2.4))) - 0.055) * 255)
+
+
 def interpolate_rgb_perceptual(start: RGB, end: RGB, t: float) -> RGB:
     """Perceptually uniform interpolation using simple luminance-weighted RGB.
 
@@ -81,21 +143,9 @@ def interpolate_rgb_perceptual(start: RGB, end: RGB, t: float) -> RGB:
     """
     t = clamp01(t)
 
-    # Convert to linear RGB for perceptual interpolation
-    def gamma_expand(c: int) -> float:
-        c_norm = c / 255.0
-        if c_norm <= 0.04045:
-            return c_norm / 12.92
-        return ((c_norm + 0.055) / 1.055) ** 2.4
-
-    def gamma_compress(linear: float) -> int:
-        if linear <= 0.0031308:
-            return int(linear * 12.92 * 255)
-        return int(((1.055 * (linear ** (1 / 2.4))) - 0.055) * 255)
-
     # Expand to linear space
-    start_linear = tuple(gamma_expand(c) for c in start)
-    end_linear = tuple(gamma_expand(c) for c in end)
+    start_linear = tuple(_gamma_expand(c) for c in start)
+    end_linear = tuple(_gamma_expand(c) for c in end)
 
     # Interpolate in linear space
     mid_linear = tuple(
@@ -104,7 +154,83 @@ def interpolate_rgb_perceptual(start: RGB, end: RGB, t: float) -> RGB:
     )
 
     # Compress back to sRGB
-    return tuple(gamma_compress(c) for c in mid_linear)
+    return tuple(_gamma_compress(c) for c in mid_linear)
+
+
+def _gradient_array(start: RGB, end: RGB, n: int, perceptual: bool) -> List[RGB]:
+    """RGB colors for n evenly spaced stops from start to end (inclusive).
+
+    Uses NumPy to interpolate all stops at once when it is installed. Linear
+    results match interpolate_rgb exactly; perceptual ones can land one step
+    off interpolate_rgb_perceptual on a channel, since NumPy's pow rounds
+    the last bit differently.
+    """
+    span = max(1, n - 1)
+    if np is None or n <= 1:
+        interp = interpolate_rgb_perceptual if perceptual else interpolate_rgb
+        return [interp(start, end, i / span) for i in range(n)]
+
+    t = (np.arange(n, dtype=np.float64) / span)[:, None]
+    if perceptual:
+        a = np.array([_gamma_expand(c) for c in start], dtype=np.float64)
+        b = np.array([_gamma_expand(c) for c in end], dtype=np.float64)
+        mid = a + (b - a) * t
+        out = np.where(
+            mid <= 0.0031308,
+            mid * 12.92 * 255,
+            ((1.055 * (mid ** (1 / 2.4))) - 0.055) * 255,
+        )
+    else:
+        a = np.array(start, dtype=np.float64)
+        b = np.array(end, dtype=np.float64)
+        out = a + (b - a) * t
+    # astype truncates toward zero, like int()
+    return [tuple(row) for row in out.astype(np.int64).tolist()]
+
+
+def _gradient_color(start: RGB, end: RGB, t: float, perceptual: bool) -> str:
+    """Hex color at position t along a start -> end gradient."""
+    if perceptual:
+        return rgb_to_hex(interpolate_rgb_perceptual(start, end, t))
+    return rgb_to_hex(interpolate_rgb(start, end, t))
+
+
+def _append_gradient(bar: Text, char: str, cells: Tuple[str, ...], count: int) -> None:
+    """Append count copies of char colored by cells, one span per color run."""
+    offset = len(bar)
+    bar.append(char * count)
+    width = len(char)
+    spans = bar.spans
+    run_start = 0
+    for i in range(1, count + 1):
+        if i == count or cells[i] != cells[run_start]:
+            spans.append(Span(offset + run_start * width, offset + i * width, cells[run_start]))
+            run_start = i
+
+
+@lru_cache(maxsize=128)
+def _gradient_cells(start_color: str, end_color: str, n: int, perceptual: bool) -> Tuple[str, ...]:
+    """Hex colors for n cells spread evenly across a gradient.
+
+    Cell colors only depend on these arguments, not on progress, so the
+    render loop indexes a cached table instead of interpolating every frame.
+    """
+    colors = _gradient_array(hex_to_rgb(start_color), hex_to_rgb(end_color), n, perceptual)
+    return tuple(rgb_to_hex(rgb) for rgb in colors)
+
+
+@lru_cache(maxsize=None)
+def _field_names(cls: type) -> Tuple[str, ...]:
+    return tuple(f.name for f in fields(cls))
+
+
+def _fields_dict(obj: Any) -> Dict[str, Any]:
+    """Shallow dataclasses.asdict().
+
+    Every field serialized this way holds a scalar, enum or callable, so
+    asdict()'s recursive deepcopy only costs time.
+    """
+    return {name: getattr(obj, name) for name in _field_names(type(obj))}
 
 
 class ProgressState(Enum):
@@ -126,6 +252,25 @@ class ColorProfile(Enum):
     TRUE_COLOR = 3  # 16M colors
 
 
+@njit(cache=True, fastmath=True)
+def _spring_step(position, velocity, target, frequency, damping, dt):
+    """One semi-implicit Euler step of a damped spring (JIT-compiled if numba is installed)."""
+    # Spring force (Hooke's law)
+    force = (target - position) * frequency
+
+    # Damping force
+    damping_force = -velocity * damping
+
+    # Total acceleration
+    acceleration = force + damping_force
+
+    # Semi-implicit Euler integration
+    velocity += acceleration * dt
+    position += velocity * dt
+
+    return position, velocity
+
+
 class Spring:
     """Simple spring physics for smooth animations.
 
@@ -157,53 +302,62 @@ class Spring:
         Returns:
             Tuple of (new_position, new_velocity)
         """
-        # Spring force (Hooke's law)
-        force = (target - position) * self.frequency
+        return _spring_step(position, velocity, target, self.frequency, self.damping, self.dt)
 
-        # Damping force
-        damping_force = -velocity * self.damping
 
-        # Total acceleration
-        acceleration = force + damping_force
+@dataclass(frozen=True, slots=True)
+class StylePreset:
+    """Full/empty character pair for a bar style."""
 
-        # Semi-implicit Euler integration
-        velocity += acceleration * self.dt
-        position += velocity * self.dt
+    full: str
+    empty: str
 
-        return position, velocity
+    def __getitem__(self, key: str) -> str:
+        """Mapping-style access (preset["full"]) for existing callers."""
+        if key not in ("full", "empty"):
+            raise KeyError(key)
+        return getattr(self, key)
 
 
-# Character sets for different visual styles
-PROGRESS_STYLES = {
-    "blocks": {"full": "█", "empty": "░"},
-    "dots": {"full": "●", "empty": "○"},
-    "arrows": {"full": "▶", "empty": "▷"},
-    "lines": {"full": "━", "empty": "─"},
-    "squares": {"full": "■", "empty": "□"},
-    "circles": {"full": "◉", "empty": "◯"},
-    "ascii": {"full": "#", "empty": "-"},
-    "equals": {"full": "=", "empty": " "},
-}
+class GradientPreset(NamedTuple):
+    """Start/end hex colors; unpacks as (start, end)."""
 
-# Partial block characters for sub-character precision
-PARTIAL_BLOCKS = ["▏", "▎", "▍", "▌", "▋", "▊", "▉", "█"]
+    start: str
+    end: str
 
-# Preset gradients
-GRADIENT_PRESETS = {
-    "purple_pink": ("#5A56E0", "#EE6FF8"),  # Default Bubbles
-    "fire": ("#ff0000", "#ffff00"),
-    "ocean": ("#0066cc", "#00cccc"),
-    "forest": ("#228b22", "#90ee90"),
-    "sunset": ("#ff4500", "#ffd700"),
-    "monochrome": ("#000000", "#ffffff"),
-    "matrix": ("#003300", "#00ff00"),
-    "neon": ("#ff00ff", "#00ffff"),
-    "ice": ("#00ffff", "#ffffff"),
-    "lava": ("#8B0000", "#FF4500"),
-}
 
+# Character sets for different visual styles. The preset tables are
+# read-only so one caller can't change them for everyone else.
+PROGRESS_STYLES = MappingProxyType({
+    "blocks": StylePreset(full="█", empty="░"),
+    "dots": StylePreset(full="●", empty="○"),
+    "arrows": StylePreset(full="▶", empty="▷"),
+    "lines": StylePreset(full="━", empty="─"),
+    "squares": StylePreset(full="■", empty="□"),
+    "circles": StylePreset(full="◉", empty="◯"),
+    "ascii": StylePreset(full="#", empty="-"),
+    "equals": StylePreset(full="=", empty=" "),
+})
 
-@dataclass
+# Partial block characters for sub-character precision
+PARTIAL_BLOCKS = ("▏", "▎", "▍", "▌", "▋", "▊", "▉", "█")
+
+# Preset gradients
+GRADIENT_PRESETS = MappingProxyType({
+    "purple_pink": GradientPreset("#5A56E0", "#EE6FF8"),  # Default Bubbles
+    "fire": GradientPreset("#ff0000", "#ffff00"),
+    "ocean": GradientPreset("#0066cc", "#00cccc"),
+    "forest": GradientPreset("#228b22", "#90ee90"),
+    "sunset": GradientPreset("#ff4500", "#ffd700"),
+    "monochrome": GradientPreset("#000000", "#ffffff"),
+    "matrix": GradientPreset("#003300", "#00ff00"),
+    "neon": GradientPreset("#ff00ff", "#00ffff"),
+    "ice": GradientPreset("#00ffff", "#ffffff"),
+    "lava": GradientPreset("#8B0000", "#FF4500"),
+})
+
+
+@dataclass(slots=True)
 class ProgressMetrics:
     """Performance metrics for progress bar rendering."""
 
@@ -223,7 +377,7 @@ class ProgressMetrics:
 
     def to_dict(self) -> dict:
         """Serialize metrics to dict."""
-        return asdict(self)
+        return _fields_dict(self)
 
     def __str__(self) -> str:
         """Human-readable metrics."""
@@ -234,7 +388,7 @@ class ProgressMetrics:
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class ProgressStyle:
     """Visual configuration for progress bars."""
 
@@ -272,7 +426,7 @@ class ProgressStyle:
 
     def to_dict(self) -> dict:
         """Serialize style to dict."""
-        d = asdict(self)
+        d = _fields_dict(self)
         d["color_profile"] = self.color_profile.value
         # percent_formatter is not serializable
         d["percent_formatter"] = None
@@ -288,7 +442,7 @@ class ProgressStyle:
         return cls(**data)
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class ProgressTheme:
     """Named theme combining style and metadata."""
 
@@ -297,8 +451,8 @@ class ProgressTheme:
     description: str
 
 
-# Built-in themes
-THEMES = {
+# Built-in themes; from_theme() hands out copies of their styles
+THEMES = MappingProxyType({
     "default": ProgressTheme(
         style=ProgressStyle(
             start_color="#ff3333",
@@ -364,7 +518,7 @@ THEMES = {
         name="Minimal",
         description="Clean and simple",
     ),
-}
+})
 
 
 @dataclass
@@ -408,23 +562,22 @@ class PureProgressBar:
             start_rgb = hex_to_rgb(style.start_color)
             end_rgb = hex_to_rgb(style.end_color)
 
-            for i in range(filled):
-                if width == 1:
-                    t = 0.5  # Middle color for single character
-                elif style.scale_gradient:
-                    # Scale gradient to filled portion
-                    t = i / max(1, filled - 1) if filled > 1 else 0.0
-                else:
-                    # Scale gradient to full width
-                    t = i / max(1, width - 1)
-
-                if style.perceptual_interpolation:
-                    color_rgb = interpolate_rgb_perceptual(start_rgb, end_rgb, t)
-                else:
-                    color_rgb = interpolate_rgb(start_rgb, end_rgb, t)
-
-                color_hex = rgb_to_hex(color_rgb)
-                bar.append(style.full_char, style=color_hex if style.color_profile != ColorProfile.ASCII else None)
+            if width == 1:
+                # Middle color for single character
+                cells = (_gradient_color(start_rgb, end_rgb, 0.5, style.perceptual_interpolation),)
+            else:
+                # Scale gradient to the filled portion, or to the full width
+                cells = _gradient_cells(
+                    style.start_color,
+                    style.end_color,
+                    filled if style.scale_gradient else width,
+                    style.perceptual_interpolation,
+                )
+
+            if style.color_profile != ColorProfile.ASCII:
+                _append_gradient(bar, style.full_char, cells, filled)
+            else:
+                bar.append(style.full_char * filled)
 
             # Add partial block if needed
             if style.use_partial_blocks and fraction > 0.01:
@@ -437,12 +590,7 @@ class PureProgressBar:
                 else:
                     t = filled / max(1, width - 1)
 
-                if style.perceptual_interpolation:
-                    color_rgb = interpolate_rgb_perceptual(start_rgb, end_rgb, t)
-                else:
-                    color_rgb = interpolate_rgb(start_rgb, end_rgb, t)
-
-                color_hex = rgb_to_hex(color_rgb)
+                color_hex = _gradient_color(start_rgb, end_rgb, t, style.perceptual_interpolation)
                 bar.append(partial_char, style=color_hex if style.color_profile != ColorProfile.ASCII else None)
                 filled += 1
         else:
@@ -508,12 +656,12 @@ class PureProgressBar:
         if style.color_profile == ColorProfile.ASCII:
             style = ProgressStyle.from_dict(style.to_dict())
             style.use_gradient = False
-            style.full_char = PROGRESS_STYLES["ascii"]["full"]
-            style.empty_char = PROGRESS_STYLES["ascii"]["empty"]
+            style.full_char = PROGRESS_STYLES["ascii"].full
+            style.empty_char = PROGRESS_STYLES["ascii"].empty
         return style
 
 
-@dataclass
+@dataclass(slots=True)
 class AnimatedProgressBar:
     """Stateful progress bar with smooth spring-based animation.
 
@@ -531,6 +679,9 @@ class AnimatedProgressBar:
     fps: int = 60
     frequency: float = 18.0  # Spring stiffness
     damping: float = 1.0  # Bounciness (higher = less bounce)
+    # Settled once within rest_delta of the target and slower than
+    # rest_delta * frequency; the bar then snaps to the target and stops
+    rest_delta: float = 1e-3
 
     # Step for increment/decrement
     step: float = 0.25
@@ -552,9 +703,10 @@ class AnimatedProgressBar:
     _display_progress: float = 0.0
     _velocity: float = 0.0
     _spring: Spring = field(init=False)
-    _last_tick: float = field(default_factory=time.monotonic)
     _last_timer_fire: float = field(default_factory=time.monotonic)
     _completed_notified: bool = False
+    # Set by ProgressGroup so target changes put the bar back on its tick list
+    _on_wake: Optional[Callable[[], None]] = field(default=None, init=False, repr=False, compare=False)
 
     # Metrics
     metrics: Optional[ProgressMetrics] = None
@@ -582,6 +734,8 @@ class AnimatedProgressBar:
         """Set absolute target progress (0.0 -> 1.0)."""
         self._target_progress = clamp01(progress)
         self._tag += 1  # Invalidate old frame messages
+        if self._on_wake:
+            self._on_wake()
 
         if self.state == ProgressState.IDLE:
             self.state = ProgressState.RUNNING
@@ -613,27 +767,44 @@ class AnimatedProgressBar:
 
         Call this from your TUI refresh/update loop (e.g., every frame/timer).
         """
+        start_time = self._begin_tick()
+
+        # Spring animation
+        if self._needs_step():
+            self._apply_step(*self._spring.update(
+                self._display_progress, self._velocity, self._target_progress
+            ))
+
+        self._end_tick(start_time)
+
+    # tick() is split into phases so ProgressGroup can run the spring step
+    # for many bars in one vectorized call between _begin_tick and _end_tick.
+    def _begin_tick(self) -> Optional[float]:
+        """Run timer-driven updates; returns the metrics start time, if any."""
         start_time = time.perf_counter() if self.metrics else None
 
-        now = time.monotonic()
-        dt = max(0.0, now - self._last_tick)
-        self._last_tick = now
+        # Timer-based auto-increment. The spring itself steps a fixed 1/fps,
+        # so the clock is only read when a timer is running.
+        if self.timer_enabled:
+            now = time.monotonic()
+            if now - self._last_timer_fire >= self.interval_seconds:
+                self._last_timer_fire = now
+                if self._target_progress < 1.0:
+                    self.incr(self.step)
 
-        # Timer-based auto-increment
-        if self.timer_enabled and now - self._last_timer_fire >= self.interval_seconds:
-            self._last_timer_fire = now
-            if self._target_progress < 1.0:
-                self.incr(self.step)
+        return start_time
 
-        # Spring animation
-        if self._display_progress < self._target_progress or abs(self._velocity) > 0.001:
-            self._display_progress, self._velocity = self._spring.update(
-                self._display_progress, self._velocity, self._target_progress
-            )
+    def _needs_step(self) -> bool:
+        """Whether the spring still has work to do this frame."""
+        return not self.is_equilibrium()
 
-            # Clamp to valid range
-            self._display_progress = clamp01(self._display_progress)
+    def _apply_step(self, position: float, velocity: float) -> None:
+        """Store a spring step result, clamped to the valid range."""
+        self._display_progress = clamp01(position)
+        self._velocity = velocity
 
+    def _end_tick(self, start_time: Optional[float]) -> None:
+        """Settle, check completion and record metrics after the spring step."""
         if self.is_equilibrium():
             self._display_progress = self._target_progress
             self._velocity = 0.0
@@ -655,9 +826,8 @@ class AnimatedProgressBar:
 
     def is_equilibrium(self) -> bool:
         """Check if the bar has settled (distance and velocity thresholds)."""
-        distance = abs(self._display_progress - self._target_progress)
-        velocity_low = abs(self._velocity) < 0.01
-        distance_low = distance < 0.001
+        distance_low = abs(self._display_progress - self._target_progress) < self.rest_delta
+        velocity_low = abs(self._velocity) < self.rest_delta * self.frequency
         return distance_low and velocity_low
 
     def is_complete(self) -> bool:
@@ -678,6 +848,8 @@ class AnimatedProgressBar:
         self._tag += 1
         self._completed_notified = False
         self.state = ProgressState.IDLE
+        if self._on_wake:
+            self._on_wake()
 
     def enable_metrics(self) -> None:
         """Enable performance metrics tracking."""
@@ -711,8 +883,8 @@ class AnimatedProgressBar:
                 f"Unknown gradient preset: {preset}. "
                 f"Available: {', '.join(GRADIENT_PRESETS.keys())}"
             )
-        start, end = GRADIENT_PRESETS[preset]
-        return self.with_gradient(start, end, scaled)
+        gradient = GRADIENT_PRESETS[preset]
+        return self.with_gradient(gradient.start, gradient.end, scaled)
 
     def with_solid_fill(self, color: str) -> "AnimatedProgressBar":
         """Set solid fill color (fluent API)."""
@@ -743,8 +915,8 @@ class AnimatedProgressBar:
                 f"Available: {', '.join(PROGRESS_STYLES.keys())}"
             )
         chars = PROGRESS_STYLES[name]
-        self.style.full_char = chars["full"]
-        self.style.empty_char = chars["empty"]
+        self.style.full_char = chars.full
+        self.style.empty_char = chars.empty
         return self
 
     def with_spring_options(self, frequency: float, damping: float) -> "AnimatedProgressBar":
@@ -768,6 +940,7 @@ class AnimatedProgressBar:
             "fps": self.fps,
             "frequency": self.frequency,
             "damping": self.damping,
+            "rest_delta": self.rest_delta,
             "step": self.step,
             "timer_enabled": self.timer_enabled,
             "interval_seconds": self.interval_seconds,
@@ -784,6 +957,7 @@ class AnimatedProgressBar:
             fps=data.get("fps", 60),
             frequency=data.get("frequency", 18.0),
             damping=data.get("damping", 1.0),
+            rest_delta=data.get("rest_delta", 1e-3),
             step=data.get("step", 0.25),
             timer_enabled=data.get("timer_enabled", False),
             interval_seconds=data.get("interval_seconds", 1.0),
@@ -808,34 +982,48 @@ class AnimatedProgressBar:
                 f"Available: {', '.join(THEMES.keys())}"
             )
         theme = THEMES[theme_name]
-        return cls(style=theme.style)
+        return cls(style=replace(theme.style))
 
     def save_to_file(self, filepath: str) -> None:
         """Save progress state to JSON file."""
-        with open(filepath, "w") as f:
-            json.dump(self.to_dict(), f, indent=2)
+        with open(filepath, "wb") as f:
+            f.write(_dumps(self.to_dict()))
 
     @classmethod
     def load_from_file(cls, filepath: str) -> "AnimatedProgressBar":
         """Load progress state from JSON file."""
-        with open(filepath, "r") as f:
-            data = json.load(f)
+        with open(filepath, "rb") as f:
+            data = _loads(f.read())
         return cls.from_dict(data)
 
 
 class ProgressGroup:
     """Manage multiple progress bars as a group."""
 
+    # Below this many bars, per-bar ticks beat building NumPy arrays
+    VECTOR_MIN_BARS = 16
+
     def __init__(self):
         self.bars: Dict[str, AnimatedProgressBar] = {}
+        # Bars that may still move; the rest are at rest and skipped by tick_all.
+        # A dict rather than a set so bars tick in the order they were added.
+        self._active: Dict[str, None] = {}
 
     def add(self, name: str, bar: AnimatedProgressBar) -> None:
         """Add a progress bar to the group."""
+        old = self.bars.get(name)
+        if old is not None and old is not bar:
+            old._on_wake = None
         self.bars[name] = bar
+        bar._on_wake = partial(self._active.setdefault, name)
+        self._active.setdefault(name)
 
     def remove(self, name: str) -> None:
         """Remove a progress bar from the group."""
-        self.bars.pop(name, None)
+        bar = self.bars.pop(name, None)
+        if bar is not None:
+            bar._on_wake = None
+        self._active.pop(name, None)
 
     def get(self, name: str) -> Optional[AnimatedProgressBar]:
         """Get a progress bar by name."""
@@ -847,9 +1035,47 @@ class ProgressGroup:
             bar.update(progress)
 
     def tick_all(self) -> None:
-        """Tick all progress bars."""
-        for bar in self.bars.values():
-            bar.tick()
+        """Tick all progress bars that are still moving.
+
+        Bars that have settled are skipped until update() or reset() wakes
+        them. Large groups step every moving spring in one NumPy pass when
+        numpy is installed; smaller ones just tick each bar.
+        """
+        if not self._active:
+            return
+        bars = [self.bars[name] for name in self._active]
+        if np is None or len(bars) < self.VECTOR_MIN_BARS:
+            for bar in bars:
+                bar.tick()
+        else:
+            self._tick_vectorized(bars)
+
+        for name in [name for name in self._active if self._is_at_rest(self.bars[name])]:
+            self._active.pop(name, None)
+
+    @staticmethod
+    def _is_at_rest(bar: AnimatedProgressBar) -> bool:
+        # A running timer can still move the target, so those bars stay active
+        return bar.is_equilibrium() and not (bar.timer_enabled and bar._target_progress < 1.0)
+
+    def _tick_vectorized(self, bars: List[AnimatedProgressBar]) -> None:
+        """tick() for many bars at once, with one array-wide spring step."""
+        start_times = [bar._begin_tick() for bar in bars]
+        moving = [bar for bar in bars if bar._needs_step()]
+        if moving:
+            n = len(moving)
+            position, velocity = _spring_step(
+                np.fromiter((bar._display_progress for bar in moving), np.float64, n),
+                np.fromiter((bar._velocity for bar in moving), np.float64, n),
+                np.fromiter((bar._target_progress for bar in moving), np.float64, n),
+                np.fromiter((bar._spring.frequency for bar in moving), np.float64, n),
+                np.fromiter((bar._spring.damping for bar in moving), np.float64, n),
+                np.fromiter((bar._spring.dt for bar in moving), np.float64, n),
+            )
+            for bar, pos, vel in zip(moving, position.tolist(), velocity.tolist()):
+                bar._apply_step(pos, vel)
+        for bar, start_time in zip(bars, start_times):
+            bar._end_tick(start_time)
 
     def render_all(self) -> Dict[str, Text]:
         """Render all progress bars."""
@@ -857,7 +1083,7 @@ class ProgressGroup:
 
     def is_any_animating(self) -> bool:
         """Check if any progress bar is animating."""
-        return any(bar.is_animating() for bar in self.bars.values())
+        return any(self.bars[name].is_animating() for name in self._active)
 
     def is_all_complete(self) -> bool:
         """Check if all progress bars are complete."""
@@ -877,16 +1103,17 @@ class ProgressGroup:
         """Deserialize progress group."""
         group = cls()
         for name, bar_data in data.items():
-            group.bars[name] = AnimatedProgressBar.from_dict(bar_data)
+            group.add(name, AnimatedProgressBar.from_dict(bar_data))
         return group
 
 
 # Convenience functions
 def format_as_fraction(total: int) -> ColorFormatter:
     """Create a formatter that shows progress as a fraction."""
+    suffix = f"/{total}"  # fixed for the formatter's lifetime
 
     def formatter(p: float) -> str:
-        return f" {int(p * total)}/{total}"
+        return f" {int(p * total)}{suffix}"
 
     return formatter
 
@@ -934,6 +1161,8 @@ __all__ = [
     "rgb_to_hex",
     "interpolate_rgb",
     "interpolate_rgb_perceptual",
+    "StylePreset",
+    "GradientPreset",
     # Constants
     "GRADIENT_PRESETS",
     "PROGRESS_STYLES",
@@ -82,8 +82,7 @@ class SlashCommandMenu(Vertical):
     def _render_commands(self) -> None:
         """Render the command list."""
         # Clear existing
-        for child in list(self.children):
-            child.remove()
+        self.remove_children()
         self.children_by_command.clear()
         
         if not self.commands:
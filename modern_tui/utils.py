@@ -1,5 +1,9 @@
+import re
+from functools import lru_cache
 from urllib.parse import urlparse, parse_qs
 
+_SEPARATOR_RE = re.compile(r"[^a-zA-Z0-9]+")
+
 
 def extract_youtube_id(url: str):
     """Extract a YouTube video id from common URL formats.
@@ -18,6 +22,7 @@ def extract_youtube_id(url: str):
     return None
 
 
+@lru_cache(maxsize=1024)
 def sanitize_id(name: str) -> str:
     """Produce a safe short id for UI element ids by keeping alphanumerics and dashes.
 
@@ -25,8 +30,6 @@ def sanitize_id(name: str) -> str:
     """
     if not name:
         return ''
-    import re
-    s = re.sub(r"[^a-zA-Z0-9_-]", "-", name)
-    # collapse multiple dashes and underscores, then strip leading/trailing dashes/underscores
-    s = re.sub(r"[-_]+", "-", s).strip("-_")
-    return s.lower()
\ No newline at end of file
+    # any run of non-alphanumerics (underscores included) becomes a single dash
+    s = _SEPARATOR_RE.sub("-", name).strip("-")
+    return s.lower()
@@ -0,0 +1,28 @@
+from modern_tui.command_palette import CommandPalette, _fuzzy_score
+
+
+def test_fuzzy_score_no_match():
+    assert _fuzzy_score('zz', 'new conversation') is None
+    assert _fuzzy_score('longer than target', 'quit') is None
+
+
+def test_fuzzy_score_prefers_word_starts():
+    assert _fuzzy_score('nc', 'new conversation') > _fuzzy_score('ew', 'new conversation')
+
+
+def test_filter_ranks_best_match_first():
+    palette = CommandPalette()
+    palette.filter_commands('ex')
+    ids = [cmd.id for cmd in palette.filtered_commands]
+    assert ids[0] == 'file.export'
+    assert 'edit.open_external_editor' in ids
+
+
+def test_filter_prefers_word_prefix_hits_over_fuzzy_matches():
+    palette = CommandPalette()
+    palette.filter_commands('e')
+    ids = [cmd.id for cmd in palette.filtered_commands]
+    # Only commands with a word starting with 'e' are listed; 'file.new'
+    # would match the fuzzy scan but is left out once the trie has hits.
+    assert sorted(ids) == ['edit.open_external_editor', 'file.export', 'file.save', 'quick.quit']
+    assert 'file.new' not in ids
@@ -1,4 +1,6 @@
-from modern_tui.compare import get_response_text
+import difflib
+
+from modern_tui.compare import _unified_diff_fast, get_response_text
 
 
 class DummyAI:
@@ -14,4 +16,17 @@ def test_get_response_text_from_conversation():
 
 def test_get_response_text_missing():
     ai = DummyAI()
-    assert get_response_text(ai, 't1', 'm2') == ''
\ No newline at end of file
+    assert get_response_text(ai, 't1', 'm2') == ''
+
+def test_get_response_text_sees_new_messages():
+    ai = DummyAI()
+    assert get_response_text(ai, 't1', 'm2') == ''
+    ai._conversations[0]['messages'].append({'role': 'assistant', 'model': 'm2', 'turn_id': 't1', 'content': 'hi'})
+    assert get_response_text(ai, 't1', 'm2') == 'hi'
+
+
+def test_unified_diff_fast_matches_difflib():
+    ta = ['a', 'b', 'c', 'd', 'e', 'f', 'g', 'h', 'i']
+    tb = ['a', 'x', 'c', 'd', 'e', 'f', 'g', 'h', 'i', 'j']
+    expected = list(difflib.unified_diff(ta, tb, fromfile='m1', tofile='m2', lineterm=''))
+    assert list(_unified_diff_fast(ta, tb, 'm1', 'm2')) == expected
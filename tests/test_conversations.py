@@ -0,0 +1,16 @@
+from modern_tui import conversations
+
+
+def test_explicit_save_supersedes_pending_flush(tmp_path, monkeypatch):
+    monkeypatch.setattr(conversations, '_CONV_PATH', tmp_path / 'conversations.json')
+    # Module-level pending state is restored afterwards, so nothing leaks to atexit
+    monkeypatch.setattr(conversations, '_dirty', False)
+    monkeypatch.setattr(conversations, '_pending', None)
+    convs = []
+    conversations.create_conversation(convs, 'a')
+    b = conversations.create_conversation(convs, 'b')
+
+    conversations.save_conversations([b])
+    conversations.flush_conversations()
+
+    assert [c['title'] for c in conversations.load_conversations()] == ['b']
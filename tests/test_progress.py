@@ -13,6 +13,7 @@ from modern_tui.progress import (
 def test_color_helpers_roundtrip():
     assert hex_to_rgb("#ff0000") == (255, 0, 0)
     assert rgb_to_hex((255, 255, 255)) == "#ffffff"
+    assert rgb_to_hex([255, 0, 0]) == "#ff0000"
 
 
 def test_clamp01():
@@ -46,6 +47,5 @@ def test_animated_tick_moves_toward_target():
     bar.update(0.5)
     # multiple ticks should reach target quickly
     for _ in range(5):
-        bar._last_tick -= 0.1
-        bar.tick()
+        bar.tick(dt=0.1)
     assert 0.49 <= bar.progress <= 0.5
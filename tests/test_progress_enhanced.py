@@ -62,6 +62,7 @@ class TestColorUtilities:
         assert rgb_to_hex((0, 255, 0)) == "#00ff00"
         assert rgb_to_hex((0, 0, 255)) == "#0000ff"
         assert rgb_to_hex((255, 255, 255)) == "#ffffff"
+        assert rgb_to_hex([255, 0, 0]) == "#ff0000"
 
     def test_roundtrip_conversion(self):
         """Test hex -> RGB -> hex roundtrip."""
@@ -353,6 +354,20 @@ class TestAnimatedProgressBar:
 
         assert bar.is_complete()
 
+    def test_settles_below_previous_value(self):
+        """Test the bar animates back down and snaps to a lower target."""
+        bar = AnimatedProgressBar()
+        bar.update(0.7)
+        for _ in range(1000):
+            bar.tick()
+        bar.decr(0.5)
+
+        for _ in range(1000):
+            bar.tick()
+
+        assert bar.progress == pytest.approx(0.2)
+        assert not bar.is_animating()
+
     def test_completion_callback(self):
         """Test completion callback is fired."""
         completed = {"called": False, "state": None}
@@ -579,6 +594,13 @@ class TestThemes:
         assert bar.style.start_color == theme.style.start_color
         assert bar.style.end_color == theme.style.end_color
 
+    def test_from_theme_copies_style(self):
+        """Test customizing a themed bar leaves the shared theme alone."""
+        bar = AnimatedProgressBar.from_theme("fire").with_hint("copy")
+
+        assert bar.style is not THEMES["fire"].style
+        assert THEMES["fire"].style.hint is None
+
     def test_invalid_theme_raises(self):
         """Test invalid theme name raises error."""
         with pytest.raises(ValueError, match="Unknown theme"):
@@ -631,6 +653,29 @@ class TestProgressGroup:
         assert bar1.progress > 0
         assert bar2.progress > 0
 
+    def test_tick_all_vectorized_matches_per_bar(self):
+        pytest.importorskip("numpy")
+
+        def build():
+            group = ProgressGroup()
+            for i in range(ProgressGroup.VECTOR_MIN_BARS + 4):
+                bar = AnimatedProgressBar(frequency=10.0 + i, damping=0.5 + i / 10)
+                bar.update((i % 5 + 1) / 5)
+                group.add(f"task{i}", bar)
+            return group
+
+        vectorized = build()
+        scalar = build()
+        for _ in range(50):
+            vectorized.tick_all()
+            for bar in scalar.bars.values():
+                bar.tick()
+
+        for name, bar in scalar.bars.items():
+            other = vectorized.get(name)
+            assert other.progress == pytest.approx(bar.progress)
+            assert other._velocity == pytest.approx(bar._velocity)
+
     def test_render_all(self):
         group = ProgressGroup()
         group.add("task1", AnimatedProgressBar())